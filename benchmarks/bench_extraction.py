@@ -0,0 +1,50 @@
+"""
+Parse-throughput benchmark: BeautifulSoup tree vs one-pass FastArticleParser
+
+Runs both extraction engines over the saved HTML pages in
+benchmarks/fixtures, checks that they return the same title and text,
+and reports pages/s and MB/s for each.
+
+Run from the repository root:
+    python benchmarks/bench_extraction.py
+"""
+import glob
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer
+
+FIXTURES = os.path.join(ROOT, 'benchmarks', 'fixtures')
+
+
+def load_pages():
+    """Read the saved HTML fixtures as raw bytes, as they arrive from the network"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, '*.html'))):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    return pages
+
+
+def main(repeat=5, number=10):
+    pages = load_pages()
+    total_mb = sum(len(page) for page in pages) / 1e6
+    engines = {name: ComprehensiveNLPAnalyzer(extraction_engine=name) for name in ('soup', 'fast')}
+
+    for page in pages:
+        assert engines['soup'].parse_article(page) == engines['fast'].parse_article(page), \
+            "extraction engines disagree"
+
+    print(f"\n{len(pages)} pages, {total_mb:.3f} MB")
+    for name, analyzer in engines.items():
+        best = min(timeit.repeat(lambda: [analyzer.parse_article(page) for page in pages],
+                                 repeat=repeat, number=number)) / number
+        print(f"{name:>5}: {len(pages) / best:8.1f} pages/s  {total_mb / best:6.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
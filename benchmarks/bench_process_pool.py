@@ -0,0 +1,58 @@
+"""
+Analyze-from-disk scaling benchmark for the process-pool scoring stage
+
+Scores the saved articles, replicated to a larger corpus, with 1..N worker
+processes and reports throughput relative to in-process scoring.
+
+Run from the repository root:
+    python benchmarks/bench_process_pool.py [copies]
+"""
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer
+
+
+def load_texts():
+    """Read the saved article texts used as the benchmark corpus"""
+    texts = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'Results', 'Extracted Files', '*.txt'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+    return texts
+
+
+def main(copies=200):
+    analyzer = ComprehensiveNLPAnalyzer()
+    analyzer.load_word_lists(ROOT)
+    corpus = load_texts() * copies
+
+    start = time.perf_counter()
+    expected = list(analyzer.analyze_texts(corpus))
+    serial = time.perf_counter() - start
+    print(f"\n{len(corpus)} documents")
+    print(f"{'in-process':>12}: {len(corpus) / serial:8.1f} docs/s")
+
+    processes = 1
+    while processes <= (os.cpu_count() or 1):
+        analyzer.start_analysis_pool(processes)
+        try:
+            start = time.perf_counter()
+            results = list(analyzer.analyze_texts(corpus))
+            elapsed = time.perf_counter() - start
+        finally:
+            analyzer.stop_analysis_pool()
+
+        assert results == expected, "process-pool results differ from in-process scoring"
+        print(f"{processes:>3} process(es): {len(corpus) / elapsed:8.1f} docs/s  "
+              f"(speedup {serial / elapsed:.2f}x)")
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
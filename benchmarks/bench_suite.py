@@ -0,0 +1,248 @@
+"""
+Benchmark suite for the analyzer hot paths
+
+Runs each stage offline over a corpus and reports docs/s, MB/s, p50/p99
+per-document latency and peak traced memory:
+
+    extract      parse_article on the HTML pages in benchmarks/fixtures
+    clean_text   stopword filtering
+    syllables    count_syllables over every word
+    syl_batch    count_syllables_batch over the same words
+    tokenize     single-pass TokenStream
+    sentences    SentenceSegmenter.count (the analyzer's sentence mode)
+    readability  calculate_readability_metrics
+    analyze      analyze_text (all metric columns)
+
+The text corpus is Results/Extracted Files, or with --size a synthetic
+corpus of that many bytes (e.g. 1MB, 100MB, 1GB) built reproducibly from
+its sentences and generated lazily, so large sizes don't need the memory.
+
+Results can be saved as a baseline and later runs compared against it;
+--compare exits with status 1 when a stage's throughput or p50 latency is
+worse than the baseline by more than --tolerance, so CI can fail on
+regressions. Compare only against baselines from the same machine; none is
+committed, so save one from a known-good checkout before comparing.
+
+Run from the repository root:
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --size 100MB --stages clean_text analyze
+    python benchmarks/bench_suite.py --save benchmarks/baselines/main.json
+    python benchmarks/bench_suite.py --compare benchmarks/baselines/main.json
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+import tracemalloc
+from itertools import chain
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import (ComprehensiveNLPAnalyzer, SENTENCE_PATTERN, WORD_PATTERN,
+                                   count_syllables_batch)
+
+FIXTURES = os.path.join(ROOT, 'benchmarks', 'fixtures')
+SIZE_UNITS = {'KB': 10 ** 3, 'MB': 10 ** 6, 'GB': 10 ** 9}
+# Documents traced per stage for the peak memory figure (tracing is slow)
+MEMORY_SAMPLE = 50
+
+
+def load_texts():
+    """Read the saved article texts used as the benchmark corpus"""
+    texts = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'Results', 'Extracted Files', '*.txt'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+    return texts
+
+
+def load_pages():
+    """Read the saved HTML fixtures as raw bytes, as they arrive from the network"""
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, '*.html'))):
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    return pages
+
+
+def parse_size(size):
+    """'100MB' -> 100000000"""
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)\s*([KMG]B)?', size.strip().upper())
+    if not match:
+        raise argparse.ArgumentTypeError(f"bad size: {size}")
+    return int(float(match.group(1)) * SIZE_UNITS.get(match.group(2), 1))
+
+
+def synthetic_corpus(texts, total_bytes, seed=0):
+    """Yield articles of seeded random sentences from texts until total_bytes are produced"""
+    sentences = [m.group().strip() for text in texts for m in SENTENCE_PATTERN.finditer(text)]
+    sentences = [s + '.' for s in sentences if len(s) > 1]
+    lengths = [len(text.encode('utf-8')) for text in texts]
+    rng = random.Random(seed)
+
+    produced = 0
+    while produced < total_bytes:
+        target = min(rng.choice(lengths), total_bytes - produced)
+        article, size = [], 0
+        while size < target:
+            sentence = rng.choice(sentences)
+            article.append(sentence)
+            size += len(sentence.encode('utf-8')) + 1
+        produced += size
+        yield ' '.join(article)
+
+
+def stages(analyzer):
+    """Stage name -> (function of one document, prepare function run outside the timing)"""
+    return {
+        'extract': (analyzer.parse_article, None),
+        'clean_text': (analyzer.clean_text, None),
+        'syllables': (lambda words: [analyzer.count_syllables(word) for word in words],
+                      lambda text: WORD_PATTERN.findall(text)),
+        'syl_batch': (count_syllables_batch, lambda text: WORD_PATTERN.findall(text)),
+        'tokenize': (lambda text: analyzer.tokenize(text).counts, None),
+        'sentences': (analyzer.segmenter.count, None),
+        'readability': (analyzer.calculate_readability_metrics, None),
+        'analyze': (analyzer.analyze_text, None),
+    }
+
+
+def run_stage(func, prepare, docs):
+    """Time func over docs one at a time; return the stage statistics"""
+    latencies = []
+    total_bytes = 0
+    memory_docs = []
+    clock = time.perf_counter
+    docs = iter(docs)
+    first = next(docs, None)
+    if first is None:
+        raise ValueError("empty corpus")
+    # Warm-up call so lazily built tables and caches aren't timed as the first document
+    func(prepare(first) if prepare else first)
+
+    for doc in chain([first], docs):
+        size = len(doc) if isinstance(doc, bytes) else len(doc.encode('utf-8'))
+        if len(memory_docs) < MEMORY_SAMPLE:
+            memory_docs.append(doc)
+        arg = prepare(doc) if prepare else doc
+        start = clock()
+        func(arg)
+        latencies.append(clock() - start)
+        total_bytes += size
+
+    # Peak memory is measured in a separate traced pass over a sample
+    tracemalloc.start()
+    for doc in memory_docs:
+        func(prepare(doc) if prepare else doc)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies = np.array(latencies)
+    seconds = latencies.sum()
+    return {
+        'docs': len(latencies),
+        'mb': total_bytes / 1e6,
+        'seconds': float(seconds),
+        'docs_per_s': len(latencies) / seconds if seconds else 0.0,
+        'mb_per_s': total_bytes / 1e6 / seconds if seconds else 0.0,
+        'p50_ms': float(np.percentile(latencies, 50) * 1000) if len(latencies) else 0.0,
+        'p99_ms': float(np.percentile(latencies, 99) * 1000) if len(latencies) else 0.0,
+        'peak_mb': peak / 1e6,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Print throughput/latency changes against a baseline, return the regressed stages"""
+    regressions = []
+    print(f"\nCompared with baseline (tolerance {tolerance:.0%}):")
+    for name, stats in results['stages'].items():
+        base = baseline['stages'].get(name)
+        if not base:
+            print(f"{name:>12}: no baseline")
+            continue
+        speed = stats['docs_per_s'] / base['docs_per_s'] - 1 if base['docs_per_s'] else 0.0
+        median = stats['p50_ms'] / base['p50_ms'] - 1 if base['p50_ms'] else 0.0
+        tail = stats['p99_ms'] / base['p99_ms'] - 1 if base['p99_ms'] else 0.0
+        # p99 over a small corpus is too noisy to gate on; it is reported only
+        regressed = speed < -tolerance or median > tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"{name:>12}: throughput {speed:+7.1%}  p50 {median:+7.1%}  p99 {tail:+7.1%}"
+              f"{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--size', type=parse_size,
+                        help="synthetic corpus size, e.g. 1MB or 1GB (default: the saved texts)")
+    parser.add_argument('--stages', nargs='+', help="stages to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=20,
+                        help="passes over the saved texts and fixtures, for stable percentiles (default 20)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--save', metavar='PATH', help="write the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="compare with a saved baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="allowed slowdown before --compare fails (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    analyzer = ComprehensiveNLPAnalyzer(extraction_engine='fast')
+    analyzer.load_word_lists(ROOT)
+    texts = load_texts()
+    pages = load_pages()
+    corpus = f"synthetic {args.size / 1e6:g} MB" if args.size else f"{len(texts)} saved texts x {args.repeat}"
+
+    available = stages(analyzer)
+    selected = args.stages or list(available)
+    unknown = set(selected) - set(available)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    results = {
+        'corpus': corpus, 'seed': args.seed,
+        'python': platform.python_version(), 'platform': platform.platform(),
+        'stages': {},
+    }
+    print(f"\nCorpus: {corpus}; HTML fixtures: {len(pages)} pages")
+    print(f"{'stage':>12} {'docs':>8} {'MB':>9} {'docs/s':>10} {'MB/s':>8} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'peak MB':>8}")
+    for name in selected:
+        func, prepare = available[name]
+        if name == 'extract':
+            docs = pages * args.repeat
+        elif args.size:
+            docs = synthetic_corpus(texts, args.size, args.seed)
+        else:
+            docs = texts * args.repeat
+        stats = run_stage(func, prepare, docs)
+        results['stages'][name] = stats
+        print(f"{name:>12} {stats['docs']:>8} {stats['mb']:>9.3f} {stats['docs_per_s']:>10.1f} "
+              f"{stats['mb_per_s']:>8.2f} {stats['p50_ms']:>8.3f} {stats['p99_ms']:>8.3f} "
+              f"{stats['peak_mb']:>8.2f}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('corpus') != corpus:
+            print(f"\nWarning: baseline corpus was {baseline.get('corpus')}")
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark: token classification with three set probes vs one bitmask lookup
+
+Run from the repository root:
+    python benchmarks/bench_token_classes.py
+"""
+import glob
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer, PERSONAL_PRONOUNS
+
+
+def load_texts():
+    """Read the saved article texts used as the benchmark corpus"""
+    texts = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'Results', 'Extracted Files', '*.txt'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+    return texts
+
+
+def set_probes(analyzer, tokens):
+    """Stopword filter, then positive and negative probes, then a pronoun list scan"""
+    cleaned = [word for word in tokens.lower if word not in analyzer.stopwords]
+    positive = sum(1 for word in cleaned if word in analyzer.positive_words)
+    negative = sum(1 for word in cleaned if word in analyzer.negative_words)
+    pronouns = sum(1 for word in tokens.lower if word in PERSONAL_PRONOUNS)
+    return len(cleaned), positive, negative, pronouns
+
+
+def bitmask_lookup(analyzer, tokens):
+    """One token_classes lookup per distinct word (counting included)"""
+    tokens.class_counts = None
+    tokens._counts = None
+    return analyzer.count_token_classes(tokens)
+
+
+def main(repeat=5, number=50):
+    analyzer = ComprehensiveNLPAnalyzer()
+    analyzer.load_word_lists(ROOT)
+    streams = [analyzer.tokenize(text) for text in load_texts()]
+
+    for tokens in streams:
+        assert set_probes(analyzer, tokens) == bitmask_lookup(analyzer, tokens)
+
+    print(f"\n{len(streams)} articles, {sum(len(t.lower) for t in streams)} tokens")
+    for name, func in [('set probes', set_probes), ('bitmask lookup', bitmask_lookup)]:
+        best = min(timeit.repeat(lambda: [func(analyzer, t) for t in streams], repeat=repeat, number=number))
+        print(f"{name:>15}: {best / number / len(streams) * 1e6:8.1f} us/article")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Per-article benchmark: single-pass TokenStream vs tokenizing once per metric
+
+Run from the repository root:
+    python benchmarks/bench_tokenizer.py
+"""
+import glob
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer
+
+
+def load_texts():
+    """Read the saved article texts used as the benchmark corpus"""
+    texts = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'Results', 'Extracted Files', '*.txt'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.append(f.read())
+    return texts
+
+
+def separate_passes(analyzer, text):
+    """Each metric tokenizes the text on its own"""
+    analyzer.calculate_sentiment_scores(text)
+    analyzer.calculate_readability_metrics(text)
+    analyzer.count_personal_pronouns(text)
+
+
+def main(repeat=5, number=20):
+    analyzer = ComprehensiveNLPAnalyzer()
+    analyzer.load_word_lists(ROOT)
+    texts = load_texts()
+
+    print(f"\n{len(texts)} articles, {sum(len(t) for t in texts)} characters")
+    for name, func in [('separate passes', lambda t: separate_passes(analyzer, t)),
+                       ('single pass', analyzer.analyze_text)]:
+        best = min(timeit.repeat(lambda: [func(t) for t in texts], repeat=repeat, number=number))
+        per_article = best / number / len(texts) * 1000
+        print(f"{name:>16}: {per_article:.3f} ms/article")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,1835 @@
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from bs4 import BeautifulSoup
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import soupsieve
 import re
 import os
 import time
-from urllib.parse import urljoin
+import random
+import threading
+import asyncio
+import json
+import hashlib
+import marshal
+import cProfile
+import heapq
+import csv
+import struct
+import sys
+import tarfile
+import zipfile
+import zlib
+from array import array
+from collections import Counter
+from contextlib import nullcontext
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from itertools import islice
+from urllib.parse import urljoin, urlparse
+from email.utils import parsedate_to_datetime
+
+# Project folder holding MasterDictionary/ and StopWords/
+DATA_DIR = "C:/Users/HP/Downloads/NLP Project"
+
+# Dictionary sources, relative to DATA_DIR
+POSITIVE_WORDS_FILE = os.path.join('MasterDictionary', 'positive-words.txt')
+NEGATIVE_WORDS_FILE = os.path.join('MasterDictionary', 'negative-words.txt')
+STOPWORD_FILES = [
+    'StopWords_Auditor.txt', 'StopWords_DatesandNumbers.txt',
+    'StopWords_Generic.txt', 'StopWords_GenericLong.txt',
+    'StopWords_Geographic.txt', 'StopWords_Names.txt'
+]
+CURRENCY_STOPWORDS = [
+    'AFGHANI', 'ARIARY', 'BAHT', 'BALBOA', 'BIRR', 'BOLIVAR', 'BOLIVIANO', 
+    'CEDI', 'COLON', 'CÓRDOBA', 'DALASI', 'DENAR', 'DINAR', 'DIRHAM', 
+    'DOBRA', 'DONG', 'DRAM', 'ESCUDO', 'EURO', 'FLORIN', 'FORINT', 
+    'GOURDE', 'GUARANI', 'GULDEN', 'HRYVNIA', 'KINA', 'KIP', 'KORUNA',
+    'KRONA', 'KRONE', 'KROON', 'KUNA', 'KWACHA', 'KWANZA', 'KYAT',
+    'LARI', 'LATS', 'LEK', 'LEMPIRA', 'LEONE', 'LEU', 'LEV', 'LILANGENI',
+    'LIRA', 'LITAS', 'LOTI', 'MANAT', 'METICAL', 'NAIRA', 'NAKFA',
+    'SHEQEL', 'NGULTRUM', 'NUEVO', 'SOL', 'OUGUIYA', 'PATACA', 'PESO',
+    'POUND', 'PULA', 'QUETZAL', 'RAND', 'REAL', 'RENMINBI', 'RIAL',
+    'RIEL', 'RINGGIT', 'RIYAL', 'RUBLE', 'RUFIYAA', 'RUPEE', 'RUPIAH',
+    'SHILLING', 'SOM', 'SOMONI', 'TAKA', 'TALA', 'TENGE', 'TUGRIK',
+    'VATU', 'WON', 'YEN', 'ZLOTY'
+]
+
+# Compiled lexicon: header, then the positive, negative and stopword sets
+# marshalled, so loading them is a single C-level unmarshal with no parsing.
+# The header stamps the size and mtime of every source file (and the marshal
+# format), so checking it needs only os.stat. Bump LEXICON_VERSION whenever
+# the way the sources are parsed changes, so stale artifacts are rebuilt.
+LEXICON_FILE = 'lexicon.bin'
+LEXICON_MAGIC = b'NLPLEX'
+LEXICON_VERSION = 2
+LEXICON_HEADER = struct.Struct('<6sH32s')
+
+
+def lexicon_source_stamp(data_dir=DATA_DIR):
+    """SHA-256 over the lexicon format and the size and mtime of every dictionary source"""
+    digest = hashlib.sha256(f"{LEXICON_VERSION}:{marshal.version}".encode())
+    sources = [POSITIVE_WORDS_FILE, NEGATIVE_WORDS_FILE]
+    sources += [os.path.join('StopWords', name) for name in STOPWORD_FILES]
+    for source in sources:
+        digest.update(source.encode('utf-8') + b'\0')
+        try:
+            stat = os.stat(os.path.join(data_dir, source))
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        except OSError:
+            digest.update(b'<missing>')
+    digest.update('\n'.join(CURRENCY_STOPWORDS).encode('utf-8'))
+    return digest.digest()
+
+
+def write_lexicon(path, stamp, positive_words, negative_words, stopwords):
+    """Write the compiled lexicon artifact atomically"""
+    payload = marshal.dumps((set(positive_words), set(negative_words), set(stopwords)))
+    with open(path + '.tmp', 'wb') as f:
+        f.write(LEXICON_HEADER.pack(LEXICON_MAGIC, LEXICON_VERSION, stamp))
+        f.write(payload)
+    os.replace(path + '.tmp', path)
+
+
+def read_lexicon(path, stamp):
+    """Return (positive, negative, stopwords) sets from a current artifact, or None"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, stamped = LEXICON_HEADER.unpack_from(data)
+        if magic != LEXICON_MAGIC or version != LEXICON_VERSION or stamped != stamp:
+            return None
+        # marshal.load on the file object reads in small chunks; loads is much faster
+        lexicon = marshal.loads(memoryview(data)[LEXICON_HEADER.size:])
+    except (OSError, struct.error, EOFError, ValueError, TypeError):
+        return None
+    if not (isinstance(lexicon, tuple) and len(lexicon) == 3
+            and all(isinstance(words, set) for words in lexicon)):
+        return None
+    return lexicon
+
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+# One match per non-blank segment between runs of . ! ?, which is what
+# re.split(r'[.!?]+', text) followed by dropping blank pieces counts
+SENTENCE_PATTERN = re.compile(r'[^.!?\s][^.!?]*')
+# Selectors probed by extract_article_text, highest priority first
+TITLE_SELECTORS = ['h1', 'title', '.entry-title', '.post-title']
+CONTENT_SELECTORS = [
+    'article', '.post-content', '.entry-content',
+    '.article-content', '.content', 'main'
+]
+
+# 'tag' or '.class' selectors, which both extraction engines can evaluate;
+# anything else is treated as a full CSS selector (soup engine only)
+SIMPLE_SELECTOR_PATTERN = re.compile(r'\.?[\w-]+')
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector):
+    """Compile a CSS selector once and reuse it across pages"""
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=256)
+def simple_selector_sets(selectors):
+    """Split a tuple of simple selectors into (tag names, class names) sets"""
+    tags = frozenset(sel for sel in selectors if not sel.startswith('.'))
+    classes = frozenset(sel[1:] for sel in selectors if sel.startswith('.'))
+    return tags, classes
+
+
+# Token classes, combined into one bitmask per vocabulary word
+STOPWORD, POSITIVE, NEGATIVE, PRONOUN = 1, 2, 4, 8
+PERSONAL_PRONOUNS = ['i', 'we', 'my', 'ours', 'us']
+
+VOWEL_RUN_PATTERN = re.compile(r'[aeiouy]+')
+
+# Bound on memoized syllable counts (keyed by lower-cased word)
+SYLLABLE_CACHE_SIZE = 200000
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def syllable_count(word):
+    """Syllables in an already lower-cased word: vowel groups, minus a silent 'e', at least 1"""
+    count = len(VOWEL_RUN_PATTERN.findall(word))
+    if word.endswith('e'):
+        count -= 1
+    return max(1, count)
+
+
+def count_syllables_batch(words):
+    """
+    Syllable counts for a whole vocabulary in one regex scan
+
+    The words are joined with spaces (never a vowel, so no vowel group can
+    span two words) and every vowel group is mapped back to its word by
+    offset. Returns a NumPy int array aligned with words.
+    """
+    lowered = [word.lower() for word in words]
+    if not lowered:
+        return np.zeros(0, dtype=np.int64)
+
+    word_ends = np.cumsum([len(word) + 1 for word in lowered])
+    group_starts = np.fromiter((m.start() for m in VOWEL_RUN_PATTERN.finditer(' '.join(lowered))),
+                               dtype=np.int64)
+    counts = np.bincount(np.searchsorted(word_ends, group_starts, side='right'),
+                         minlength=len(lowered))
+    counts -= np.fromiter((word.endswith('e') for word in lowered), dtype=bool, count=len(lowered))
+    return np.maximum(counts, 1)
+
+
+# Abbreviation-aware sentence boundaries: a run of . ! ? plus any closing
+# quotes/brackets, followed by whitespace or the end of the text
+BOUNDARY_PATTERN = re.compile(r'([.!?]+)[\'")\]”’]*(?=\s|\Z)')
+WORD_CHAR_PATTERN = re.compile(r'\w')
+NON_SPACE_PATTERN = re.compile(r'\S')
+LAST_WORD_PATTERN = re.compile(r'\w+\Z')
+# Characters before a '.' searched for the abbreviation in front of it
+ABBREVIATION_LOOKBACK = 16
+# Carried text beyond this (between chunks) is folded into a flag
+CHUNK_CARRY_LIMIT = 4096
+# Words that often end a sentence too (etc, no) are left out
+ABBREVIATIONS = frozenset([
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'mt', 'vs', 'al', 'eg', 'ie',
+    'inc', 'ltd', 'co', 'corp', 'dept', 'univ', 'vol', 'fig', 'approx',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+    'rs', 'govt', 'gen', 'col', 'lt', 'sgt', 'rev', 'hon', 'ph', 'cf', 'op', 'pp',
+])
+
+
+class SentenceSegmenter:
+    """
+    Counts sentences in one regex scan without building the sentence strings
+
+    'compat' counts exactly what SENTENCE_PATTERN counts: every non-blank
+    piece between runs of . ! ?. 'abbreviations' only ends a sentence at
+    terminators followed by whitespace (so 3.5 and example.com don't split),
+    not at a single '.' after a known abbreviation or a one-letter initial,
+    and only counts pieces containing a word character.
+
+    count_chunks() gives the same count over text arriving in pieces,
+    holding back only the text after the last settled boundary.
+    """
+
+    MODES = ('compat', 'abbreviations')
+
+    def __init__(self, mode='compat', abbreviations=ABBREVIATIONS):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown sentence mode: {mode}")
+        self.mode = mode
+        self.abbreviations = frozenset(word.lower().rstrip('.') for word in abbreviations)
+
+    def count(self, text):
+        """Number of sentences in text"""
+        if self.mode == 'compat':
+            return sum(1 for _ in SENTENCE_PATTERN.finditer(text))
+        return self._scan(text, 0, False, True)[0]
+
+    def count_chunks(self, chunks):
+        """Number of sentences in the concatenation of chunks (str pieces)"""
+        if self.mode == 'compat':
+            return self._count_compat_chunks(chunks)
+
+        total, carry, start, pending = 0, '', 0, False
+        for chunk in chunks:
+            text = carry + chunk
+            count, cut, start = self._scan(text, start, pending, False)
+            total += count
+            if cut:
+                pending = False
+            carry = text[cut:]
+            start -= cut
+            # Everything before the abbreviation lookback of the first
+            # unsettled boundary is settled; only its word content matters
+            trim = start - ABBREVIATION_LOOKBACK
+            if trim > CHUNK_CARRY_LIMIT:
+                pending = pending or WORD_CHAR_PATTERN.search(carry, 0, trim) is not None
+                carry = carry[trim:]
+                start -= trim
+        return total + self._scan(carry, start, pending, True)[0]
+
+    def _count_compat_chunks(self, chunks):
+        """count_chunks for compat mode: cut after the last terminator of each piece"""
+        total, carry = 0, ''
+        for chunk in chunks:
+            text = carry + chunk
+            cut = max(text.rfind('.'), text.rfind('!'), text.rfind('?')) + 1
+            total += sum(1 for _ in SENTENCE_PATTERN.finditer(text, 0, cut))
+            # No terminator after cut, so the rest is one open piece and all
+            # that matters is whether it is blank
+            carry = 'x' if NON_SPACE_PATTERN.search(text, cut) else ''
+        return total + (carry == 'x')
+
+    def _abbreviated(self, text, pos):
+        """True if the '.' at pos follows a known abbreviation or an initial"""
+        match = LAST_WORD_PATTERN.search(text, max(0, pos - ABBREVIATION_LOOKBACK), pos)
+        if not match:
+            return False
+        word = match.group().lower()
+        return (len(word) == 1 and word.isalpha()) or word in self.abbreviations
+
+    def _scan(self, text, start, pending, final):
+        """
+        Count abbreviation-mode sentences ended by boundaries found from start
+
+        pending says the open sentence at the head of text already holds a
+        word. Unless final, a boundary touching the end of text is left
+        for the next chunk. Returns (count, end of the last boundary,
+        position to resume scanning from).
+        """
+        count, segment, resume = 0, 0, len(text)
+        for match in BOUNDARY_PATTERN.finditer(text, start):
+            if not final and match.end() == len(text):
+                resume = match.start()
+                break
+            if match.group(1) == '.' and self._abbreviated(text, match.start()):
+                continue
+            if pending or WORD_CHAR_PATTERN.search(text, segment, match.start()):
+                count += 1
+            segment, pending = match.end(), False
+        if final and (pending or WORD_CHAR_PATTERN.search(text, segment)):
+            count += 1
+        return count, segment, resume
+
+
+@lru_cache(maxsize=32)
+def sentence_segmenter(mode='compat', abbreviations=ABBREVIATIONS):
+    """Shared SentenceSegmenter for a mode and (frozenset) abbreviation list"""
+    return SentenceSegmenter(mode, abbreviations)
+
+
+class TokenStream:
+    """
+    Single tokenization pass over an article, shared by every metric
+
+    The text is lower-cased once and tokenized once. str.lower() maps
+    characters one-for-one and keeps their word/non-word class for everything
+    except U+0130, so whenever the lengths match the lower-cased tokens carry
+    the same lengths and syllables as the original ones and readability can
+    use them directly. Original-case tokens are only built on request.
+    """
+
+    __slots__ = ('text', 'lower', 'aligned', 'sentence_count', '_words', '_counts', 'class_counts')
+
+    def __init__(self, text, segmenter=None):
+        self.text = text
+        lowered = text.lower()
+        self.lower = WORD_PATTERN.findall(lowered)
+        self.aligned = len(lowered) == len(text)
+        self.sentence_count = (segmenter or sentence_segmenter()).count(text)
+        self._words = None
+        self._counts = None
+        # (token class map, counts) cached by count_token_classes
+        self.class_counts = None
+
+    @property
+    def words(self):
+        """Tokens in their original case"""
+        if self._words is None:
+            self._words = WORD_PATTERN.findall(self.text)
+        return self._words
+
+    @property
+    def measure_words(self):
+        """Tokens to use for length and syllable metrics"""
+        return self.lower if self.aligned else self.words
+
+    @property
+    def counts(self):
+        """Frequency of each lower-cased token"""
+        if self._counts is None:
+            self._counts = Counter(self.lower)
+        return self._counts
+
+
+# Numeric references not ended by ';' keep their leading digits (as bs4 does)
+DECIMAL_CHARREF_PATTERN = re.compile(r'^([0-9]+)(.*)')
+HEX_CHARREF_PATTERN = re.compile(r'^([0-9a-f]+)(.*)')
+
+
+def numeric_charref(name):
+    """
+    (text, trailing data) for the numeric character reference &#name;
+
+    Follows the HTML spec's numeric character reference end state, the way
+    bs4's html.parser builder applies it: NUL, surrogates and code points
+    past U+10FFFF become U+FFFD, and C1 controls that are Windows-1252
+    characters become those characters.
+    """
+    base, pattern = 10, DECIMAL_CHARREF_PATTERN
+    if name[:1] in ('x', 'X'):
+        name, base, pattern = name[1:], 16, HEX_CHARREF_PATTERN
+    extra = ''
+    try:
+        number = int(name, base)
+    except ValueError:
+        match = pattern.search(name)
+        if match is None:
+            return '', name
+        number, extra = int(match.group(1), base), match.group(2)
+
+    if number == 0 or number > 0x10FFFF or 0xD800 <= number <= 0xDFFF:
+        return '\ufffd', extra
+    if 0x80 <= number <= 0x9F:
+        try:
+            return bytes([number]).decode('cp1252'), extra
+        except UnicodeDecodeError:
+            pass
+    return chr(number), extra
+
+
+class FastArticleParser(HTMLParser):
+    """
+    One-pass title/content extractor matching the BeautifulSoup engine
+
+    Instead of building a tree, visible text is appended to one flat list
+    and every element matching a title or content selector (or a <p>, for
+    the fallback) records the range of text nodes it spans. Tree rules
+    follow bs4's html.parser builder: an end tag closes back to the most
+    recent open tag of that name and void elements close immediately.
+    Strings inside script/style/template/rt/rp are not ordinary text; a
+    matched template/rt/rp element keeps its own strings instead, the way
+    its bs4 get_text() does, and script/style elements are dropped.
+    """
+
+    # bs4's html.parser builder defaults (empty_element_tags, string_containers)
+    VOID_ELEMENTS = frozenset([
+        'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'menuitem',
+        'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound', 'command', 'frame',
+        'image', 'isindex', 'nextid', 'spacer',
+    ])
+    STRING_CONTAINERS = frozenset(['rt', 'rp', 'style', 'script', 'template'])
+    RAW_ELEMENTS = frozenset(['script', 'style'])
+
+    def __init__(self, title_selectors=TITLE_SELECTORS, content_selectors=CONTENT_SELECTORS):
+        super().__init__(convert_charrefs=False)
+        # Only simple selectors can be matched while streaming
+        self.title_selectors = [sel for sel in title_selectors if SIMPLE_SELECTOR_PATTERN.fullmatch(sel)]
+        self.content_selectors = [sel for sel in content_selectors if SIMPLE_SELECTOR_PATTERN.fullmatch(sel)]
+        selectors = tuple(dict.fromkeys(self.title_selectors + self.content_selectors + ['p']))
+        self.tag_selectors, self.class_selectors = simple_selector_sets(selectors)
+        self.nodes = []
+        # Open elements: (tag, spans recorded by this element, own strings or None)
+        self.stack = []
+        self.open_counts = Counter()
+        # Names of open string containers, innermost last
+        self.containers = []
+        # (name, strings) for matched template/rt/rp elements still open
+        self.own_captures = []
+        self.raw_depth = 0
+        self.matches = {sel: [] for sel in selectors}
+
+    def handle_starttag(self, tag, attrs):
+        self._open(tag, attrs)
+        if tag in self.VOID_ELEMENTS:
+            self._close_to(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self._open(tag, attrs)
+        self._close_to(tag)
+
+    def handle_endtag(self, tag):
+        self._close_to(tag)
+
+    def handle_data(self, data):
+        if not self.containers:
+            self.nodes.append(data)
+        elif self.own_captures:
+            innermost = self.containers[-1]
+            for name, strings in self.own_captures:
+                if name == innermost:
+                    strings.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name, '&' + name))
+
+    def handle_charref(self, name):
+        # Same numeric-reference repair rules as the soup engine
+        text, extra = numeric_charref(name)
+        self.handle_data(text)
+        self.handle_data(extra)
+
+    def unknown_decl(self, data):
+        # CDATA sections are text for ordinary elements unless inside script/style
+        if data.upper().startswith('CDATA[') and not self.raw_depth:
+            self.nodes.append(data[len('CDATA['):])
+
+    def _open(self, tag, attrs):
+        selectors = [tag] if tag in self.tag_selectors else []
+        class_value = None
+        for name, value in attrs:
+            if name == 'class':
+                class_value = value or ''
+        if class_value:
+            selectors.extend('.' + cls for cls in set(class_value.split()) & self.class_selectors)
+
+        spans = []
+        own = None
+        if tag in self.STRING_CONTAINERS:
+            self.containers.append(tag)
+            if tag in self.RAW_ELEMENTS:
+                # Decomposed before the soup engine searches, so never matched
+                self.raw_depth += 1
+                selectors = []
+            elif selectors:
+                own = []
+                self.own_captures.append((tag, own))
+
+        for selector in selectors:
+            span = [None, None, own] if own is not None else [len(self.nodes), None]
+            self.matches[selector].append(span)
+            spans.append(span)
+
+        self.stack.append((tag, spans, own))
+        self.open_counts[tag] += 1
+
+    def _close_to(self, tag):
+        if not self.open_counts[tag]:
+            return
+        while True:
+            name, spans, own = self.stack.pop()
+            for span in spans:
+                span[1] = len(self.nodes)
+            self.open_counts[name] -= 1
+            if name in self.STRING_CONTAINERS:
+                self.containers.pop()
+                if name in self.RAW_ELEMENTS:
+                    self.raw_depth -= 1
+                elif own is not None:
+                    self.own_captures.pop()
+            if name == tag:
+                return
+
+    def text(self, span):
+        """Text of one matched element"""
+        if len(span) == 3:
+            return ''.join(span[2])
+        end = len(self.nodes) if span[1] is None else span[1]
+        return ''.join(self.nodes[span[0]:end])
+
+    def extract(self):
+        """Return (title, article_text, title selector, content selector) via the selector cascade
+
+        The selectors are the ones that matched, or None when nothing did
+        (content then falls back to the page's <p> elements).
+        """
+        title, title_selector = "", None
+        for selector in self.title_selectors:
+            if self.matches[selector]:
+                title = self.text(self.matches[selector][0]).strip()
+                title_selector = selector
+                break
+
+        article_text, content_selector = "", None
+        for selector in self.content_selectors:
+            if self.matches[selector]:
+                article_text = ' '.join(self.text(span) for span in self.matches[selector])
+                content_selector = selector
+                break
+
+        if not article_text:
+            article_text = ' '.join(self.text(span) for span in self.matches['p'])
+        return title, article_text, title_selector, content_selector
+
+
+class ExtractionProfiles:
+    """
+    Per-host extraction profiles: which title/content selector to try first
+
+    A profile is either configured up front (any CSS selector) or, when
+    learn_after is set, learned: once the same selector has won learn_after
+    times for a host, it moves to the front of the cascade for that host's
+    later pages. The generic cascade stays behind it as the fallback.
+    Learning is off by default because what a page extracts then depends on
+    which pages of the host were processed before it.
+    """
+
+    def __init__(self, configured=None, learn_after=0):
+        self.profiles = {host.lower(): dict(profile) for host, profile in (configured or {}).items()}
+        self.configured = {(host, kind) for host, profile in self.profiles.items() for kind in profile}
+        self._configured_profiles = {host: dict(profile) for host, profile in self.profiles.items()}
+        self.learn_after = learn_after
+        self._wins = Counter()
+        self._lock = threading.Lock()
+
+    def selectors(self, host, kind, generic):
+        """Selector cascade for a host: its profile selector first, then the generic list"""
+        preferred = self.profiles.get(host, {}).get(kind)
+        if not preferred:
+            return generic
+        return [preferred] + [sel for sel in generic if sel != preferred]
+
+    def record(self, host, kind, selector):
+        """Count a winning selector and adopt it for the host once it is established"""
+        if not host or not selector or not self.learn_after or (host, kind) in self.configured:
+            return
+        with self._lock:
+            self._wins[host, kind, selector] += 1
+            if self._wins[host, kind, selector] >= self.learn_after:
+                self.profiles.setdefault(host, {})[kind] = selector
+
+    def params(self):
+        """Settings that decide which selectors are tried, for the scoring key"""
+        return {'configured': self._configured_profiles, 'learn_after': self.learn_after}
+
+    def to_dict(self):
+        """Current profiles (configured and learned), e.g. to save and pass back in later"""
+        with self._lock:
+            return {host: dict(profile) for host, profile in self.profiles.items()}
+
+
+class BoilerplateFilter:
+    """
+    Cross-page boilerplate removal by text-shingle fingerprinting
+
+    For each host, learn() counts the word shingles near the start and end
+    of a page (where navigation, bylines and related-article lists sit) by
+    the number of distinct pages they appear on. strip() only reads those
+    tables: once a host has min_pages pages, shingles found on at least
+    `ratio` of them are treated as site template and the words they cover
+    are dropped. Learning every page before stripping any makes the result
+    independent of the order pages arrive in; the batch runs do that, and
+    streaming runs strip with templates learned earlier and saved to path.
+    """
+
+    def __init__(self, path=None, shingle_size=4, edge_words=200, min_pages=3, ratio=0.5):
+        self.path = path
+        self.shingle_size = shingle_size
+        self.edge_words = edge_words
+        self.min_pages = min_pages
+        self.ratio = ratio
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    def params(self):
+        """Settings that change which words are stripped"""
+        return {'shingle_size': self.shingle_size, 'edge_words': self.edge_words,
+                'min_pages': self.min_pages, 'ratio': self.ratio}
+
+    @staticmethod
+    def fingerprint(text):
+        """Stable 64-bit fingerprint (Python's hash() is salted per process)"""
+        return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    def shingles(self, words):
+        """(word index, fingerprint) of the shingles at the page edges"""
+        k = self.shingle_size
+        last_start = len(words) - k
+        if last_start < 0:
+            return []
+        head = range(0, min(self.edge_words, last_start + 1))
+        tail = range(max(head.stop, len(words) - self.edge_words), last_start + 1)
+        return [(i, self.fingerprint(' '.join(words[i:i + k]))) for i in (*head, *tail)]
+
+    def learn(self, host, text):
+        """Count a page's edge shingles for its host (a page seen before is not counted twice)"""
+        shingles = self.shingles(text.split())
+        if not shingles:
+            return
+        page_print = self.fingerprint(text)
+        with self._lock:
+            table = self.hosts.setdefault(host, {'pages': 0, 'seen': set(), 'counts': Counter()})
+            if page_print not in table['seen']:
+                table['seen'].add(page_print)
+                table['pages'] += 1
+                table['counts'].update({fp for _, fp in shingles})
+
+    def strip(self, host, text):
+        """Return the page without the template text learned for its host"""
+        table = self.hosts.get(host)
+        if table is None or table['pages'] < self.min_pages:
+            return text
+        words = text.split()
+        shingles = self.shingles(words)
+        with self._lock:
+            threshold = max(self.min_pages, self.ratio * table['pages'])
+            template = [i for i, fp in shingles if table['counts'][fp] >= threshold]
+        if not template:
+            return text
+        k = self.shingle_size
+        drop = bytearray(len(words))
+        for i in template:
+            drop[i:i + k] = b'\x01' * k
+        return ' '.join(word for word, dropped in zip(words, drop) if not dropped)
+
+    def load(self):
+        """Load templates saved by an earlier run, unless they were built with other settings"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read boilerplate templates {self.path}: {e}")
+            return
+        if saved.get('params') != self.params():
+            print(f"Boilerplate templates {self.path} were built with other settings; starting new ones")
+            return
+        with self._lock:
+            self.hosts = {host: {'pages': table['pages'], 'seen': set(table['seen']),
+                                 'counts': Counter(dict(table['counts']))}
+                          for host, table in saved['hosts'].items()}
+        print(f"Loaded boilerplate templates for {len(self.hosts)} hosts from {self.path}")
+
+    def save(self):
+        """Write the templates to path atomically (shingles seen on one page only are left out)"""
+        if not self.path:
+            return
+        with self._lock:
+            hosts = {host: {'pages': table['pages'], 'seen': sorted(table['seen']),
+                            'counts': sorted([fp, n] for fp, n in table['counts'].items() if n > 1)}
+                     for host, table in self.hosts.items()}
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'params': self.params(), 'hosts': hosts}, f)
+        os.replace(self.path + '.tmp', self.path)
+
+
+class HostUnavailable(requests.ConnectionError):
+    """Raised without a request while a host's circuit breaker is open"""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised once the run deadline has passed"""
+
+
+class ResponseRejected(requests.RequestException):
+    """Raised when a download is aborted for its content type or size"""
+
+
+# Leading bytes of common binary formats served where pages were expected
+BINARY_SIGNATURES = [
+    (b'%PDF', 'PDF'), (b'\x89PNG', 'PNG'), (b'\xff\xd8\xff', 'JPEG'), (b'GIF8', 'GIF'),
+    (b'PK\x03\x04', 'ZIP'), (b'\x1f\x8b', 'gzip'), (b'ID3', 'MP3'), (b'OggS', 'Ogg'),
+    (b'RIFF', 'RIFF'), (b'\x1aE\xdf\xa3', 'Matroska/WebM'),
+]
+
+
+class FetchPolicy:
+    """
+    Retry, timeout and download limits for article downloads
+
+    Connection errors, timeouts and retry_statuses are retried up to
+    `retries` times with exponential backoff (backoff * 2**attempt, capped
+    at max_backoff) and jitter. A Retry-After header sets the minimum wait;
+    one longer than max_retry_after is not waited for. timeout is passed to
+    requests as is, so it can be a (connect, read) pair.
+
+    Bodies are streamed: a response whose Content-Type is not in
+    content_types, or that grows past max_bytes (after decompression), is
+    aborted before the rest is downloaded. Responses without a Content-Type
+    are sniffed for binary signatures. None turns either check off.
+    """
+
+    def __init__(self, retries=2, backoff=0.5, max_backoff=30.0, jitter=0.5, timeout=(5, 10),
+                 retry_statuses=(429, 500, 502, 503, 504), max_retry_after=60.0,
+                 max_bytes=5 * 1024 * 1024, content_types=('text/html', 'application/xhtml+xml')):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.timeout = timeout
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.max_bytes = max_bytes
+        self.content_types = frozenset(content_types) if content_types else None
+
+    def retry_delay(self, attempt, retry_after=None):
+        """Seconds to wait before retry number attempt + 1, or None to give up"""
+        if attempt >= self.retries:
+            return None
+        base = min(self.max_backoff, self.backoff * 2 ** attempt)
+        delay = random.uniform(base * (1 - self.jitter), base)
+        wait = self.parse_retry_after(retry_after)
+        if wait is not None:
+            if wait > self.max_retry_after:
+                return None
+            delay = max(delay, wait)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value):
+        """Retry-After header (seconds or HTTP date) as seconds from now, or None"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class BoundedBody:
+    """Collects a streamed response body within a FetchPolicy's type and size limits"""
+
+    def __init__(self, policy, headers):
+        self.max_bytes = policy.max_bytes
+        self.chunks = []
+        self.size = 0
+
+        content_type = headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type and policy.content_types and content_type not in policy.content_types:
+            raise ResponseRejected(f"unsupported content type: {content_type}")
+        declared = headers.get('Content-Length', '')
+        if self.max_bytes and declared.isdigit() and int(declared) > self.max_bytes:
+            raise ResponseRejected(f"response larger than {self.max_bytes} bytes")
+        self.sniff = not content_type
+
+    def add(self, chunk):
+        """Append a chunk, raising ResponseRejected when a limit is broken"""
+        if self.sniff and chunk:
+            self.sniff = False
+            for signature, kind in BINARY_SIGNATURES:
+                if chunk.startswith(signature):
+                    raise ResponseRejected(f"binary content: {kind}")
+            if b'\0' in chunk[:1024]:
+                raise ResponseRejected("binary content")
+        self.size += len(chunk)
+        if self.max_bytes and self.size > self.max_bytes:
+            raise ResponseRejected(f"response larger than {self.max_bytes} bytes")
+        self.chunks.append(chunk)
+
+    def data(self):
+        """The body read so far"""
+        return b''.join(self.chunks)
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker
+
+    After failure_threshold consecutive failed attempts (connection errors,
+    timeouts, 5xx) a host's circuit opens and its URLs fail immediately
+    with HostUnavailable. After reset_after seconds one trial request is let
+    through; success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=5, reset_after=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self._lock = threading.Lock()
+        self._failures = Counter()
+        self._opened = {}
+        self._probing = set()
+
+    def check(self, host):
+        """Raise HostUnavailable unless a request to host may go out now
+
+        Returns True when the request is the half-open trial; the caller
+        must then end it with record_success, record_failure or release.
+        """
+        with self._lock:
+            opened = self._opened.get(host)
+            if opened is None:
+                return False
+            if time.monotonic() - opened < self.reset_after or host in self._probing:
+                raise HostUnavailable(f"circuit open for {host}")
+            self._probing.add(host)
+            return True
+
+    def release(self, host, probe):
+        """End a trial request whose outcome said nothing about the host's health"""
+        if probe:
+            with self._lock:
+                self._probing.discard(host)
+
+    def record_success(self, host):
+        """Close the host's circuit"""
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened.pop(host, None)
+            self._probing.discard(host)
+
+    def record_failure(self, host):
+        """Count a failed attempt, opening the circuit at the threshold"""
+        with self._lock:
+            self._failures[host] += 1
+            self._probing.discard(host)
+            if self._failures[host] >= self.failure_threshold:
+                self._opened[host] = time.monotonic()
+
+    def is_open(self, host):
+        """Whether the host's circuit is open (or half-open)"""
+        return host in self._opened
+
+
+# Download errors that count against the circuit breaker and are retried
+RETRYABLE_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+
+def failure_reason(error):
+    """Short, stable description of why an article could not be fetched"""
+    if isinstance(error, (HostUnavailable, ResponseRejected)):
+        return str(error)
+    if isinstance(error, DeadlineExceeded):
+        return "run deadline exceeded"
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return f"HTTP {error.response.status_code}"
+    if isinstance(error, requests.Timeout):
+        return "timeout"
+    if isinstance(error, requests.ConnectionError):
+        return "connection error"
+    return f"{type(error).__name__}: {error}"
+
+
+class HostRateLimiter:
+    """
+    Per-host politeness for concurrent fetching
+
+    Each host gets its own minimum delay between request starts and its own
+    cap on in-flight requests, so different domains can be fetched in
+    parallel while any single host sees the same pacing as a serial crawl.
+    """
+
+    def __init__(self, delay=0.5, max_per_host=1, host_delays=None):
+        self.delay = delay
+        self.max_per_host = max_per_host
+        self.host_delays = {host.lower(): d for host, d in (host_delays or {}).items()}
+        self._lock = threading.Lock()
+        self._next_slot = {}
+        self._slots = {}
+
+    def acquire(self, url):
+        """Block until a request to the URL's host is allowed, return the host key"""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slots = self._slots.get(host)
+            if slots is None:
+                slots = self._slots[host] = threading.BoundedSemaphore(self.max_per_host)
+        slots.acquire()
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = start + self.host_delays.get(host, self.delay)
+
+        if start > now:
+            time.sleep(start - now)
+        return host
+
+    def release(self, host):
+        """Free the host's concurrency slot once its download has finished"""
+        self._slots[host].release()
+
+
+class AsyncHostRateLimiter:
+    """
+    HostRateLimiter for a single event loop
+
+    Same per-host delay and in-flight cap, but waiting is done with asyncio
+    semaphores and sleeps so other fetches keep running meanwhile.
+    """
+
+    def __init__(self, delay=0.5, max_per_host=1, host_delays=None):
+        self.delay = delay
+        self.max_per_host = max_per_host
+        self.host_delays = {host.lower(): d for host, d in (host_delays or {}).items()}
+        self._next_slot = {}
+        self._slots = {}
+
+    async def acquire(self, url):
+        """Wait until a request to the URL's host is allowed, return the host key"""
+        host = urlparse(url).netloc.lower()
+        slots = self._slots.get(host)
+        if slots is None:
+            slots = self._slots[host] = asyncio.Semaphore(self.max_per_host)
+        await slots.acquire()
+
+        # No lock needed: nothing else runs on the loop between these lines
+        now = time.monotonic()
+        start = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = start + self.host_delays.get(host, self.delay)
+
+        if start > now:
+            try:
+                await asyncio.sleep(start - now)
+            except asyncio.CancelledError:
+                # Cancelled while pacing: the caller never gets the slot to release
+                slots.release()
+                raise
+        return host
+
+    def release(self, host):
+        """Free the host's concurrency slot once its download has finished"""
+        self._slots[host].release()
+
+
+class ResponseCache:
+    """
+    Persistent on-disk cache of raw HTML responses
+
+    Entries are keyed by the SHA-256 of the URL and stored as a body file
+    plus a small JSON sidecar holding the ETag/Last-Modified validators.
+    When the total size exceeds max_bytes the least recently used entries
+    are evicted.
+    """
+
+    def __init__(self, cache_dir="http_cache", max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # key -> body size, used to track the cache size without rescanning
+        self._sizes = {}
+        for name in os.listdir(cache_dir):
+            if name.endswith('.html'):
+                self._sizes[name[:-5]] = os.path.getsize(os.path.join(cache_dir, name))
+        self.total_bytes = sum(self._sizes.values())
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return key, base + '.html', base + '.json'
+
+    def get(self, url):
+        """Return (metadata, body) for a cached URL, or None"""
+        key, body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        # Body mtime doubles as the last-used time for LRU eviction. Another
+        # thread may have evicted the entry since it was read; the body
+        # already in hand is still good
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        return meta, body
+
+    def put(self, url, body, etag=None, last_modified=None):
+        """Store a response body with its revalidation headers"""
+        key, body_path, meta_path = self._paths(url)
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified,
+                'size': len(body), 'stored_at': time.time()}
+
+        with self._lock:
+            with open(body_path + '.tmp', 'wb') as f:
+                f.write(body)
+            with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            os.replace(body_path + '.tmp', body_path)
+            os.replace(meta_path + '.tmp', meta_path)
+
+            self.total_bytes += len(body) - self._sizes.get(key, 0)
+            self._sizes[key] = len(body)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        entries = []
+        for key in self._sizes:
+            try:
+                entries.append((os.path.getmtime(os.path.join(self.cache_dir, key + '.html')), key))
+            except OSError:
+                entries.append((0, key))
+
+        for _, key in sorted(entries):
+            if self.total_bytes <= self.max_bytes:
+                break
+            for ext in ('.html', '.json'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, key + ext))
+                except OSError:
+                    pass
+            self.total_bytes -= self._sizes.pop(key)
+
+
+# Shared no-op stage timer handed out when instrumentation is off
+NULL_TIMER = nullcontext()
+REPORT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class StageTimer:
+    """Context manager that adds its elapsed time to a RunMetrics stage"""
+
+    __slots__ = ('metrics', 'stage', 'start')
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+
+
+class RunMetrics:
+    """
+    Structured instrumentation for one analyzer run
+
+    Collects per-stage timings, counters, an HTTP status histogram and
+    per-host fetch latencies and bytes. report() returns them as a dict
+    (with p50/p90/p99 for every timing), save() writes it as JSON, or as
+    Prometheus text exposition when the path ends in .prom. The analyzer
+    only touches this when instrumentation is on; otherwise its timers
+    are a shared no-op context manager.
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages = {}          # stage -> array of seconds
+        self.counters = Counter()
+        self.statuses = Counter()
+        self.host_latency = {}    # host -> array of fetch seconds
+        self.host_bytes = Counter()
+
+    def timer(self, stage):
+        """Context manager timing one occurrence of a stage"""
+        return StageTimer(self, stage)
+
+    def observe(self, stage, seconds):
+        """Record one timing for a stage"""
+        with self._lock:
+            samples = self.stages.get(stage)
+            if samples is None:
+                samples = self.stages[stage] = array('d')
+            samples.append(seconds)
+
+    def count(self, name, n=1):
+        """Increment a counter"""
+        with self._lock:
+            self.counters[name] += n
+
+    def record_response(self, host, status, size, seconds):
+        """Record one HTTP response (status may be 'error' when no response arrived)"""
+        with self._lock:
+            self.statuses[str(status)] += 1
+            self.host_bytes[host] += size
+            self.counters['bytes_downloaded'] += size
+            samples = self.host_latency.get(host)
+            if samples is None:
+                samples = self.host_latency[host] = array('d')
+            samples.append(seconds)
+
+    @staticmethod
+    def summarize(samples):
+        """count, total and quantiles (ms) for an array of seconds"""
+        values = np.frombuffer(samples, dtype=np.float64) if len(samples) else np.zeros(1)
+        summary = {'count': len(samples), 'total_s': float(values.sum()) if len(samples) else 0.0}
+        for q, value in zip(REPORT_QUANTILES, np.quantile(values, REPORT_QUANTILES)):
+            summary[f'p{round(q * 100)}_ms'] = float(value * 1000)
+        return summary
+
+    def report(self):
+        """The run report as a JSON-serializable dict"""
+        with self._lock:
+            return {
+                'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+                'elapsed_s': time.perf_counter() - self._start,
+                'stages': {stage: self.summarize(samples) for stage, samples in sorted(self.stages.items())},
+                'counters': dict(sorted(self.counters.items())),
+                'http_status': dict(sorted(self.statuses.items())),
+                'hosts': {
+                    host: dict(self.summarize(samples), bytes=self.host_bytes[host])
+                    for host, samples in sorted(self.host_latency.items())
+                },
+            }
+
+    def prometheus(self, prefix='nlp'):
+        """The run report in Prometheus text exposition format"""
+        report = self.report()
+        lines = []
+
+        def summary(name, help_text, label, items):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} summary")
+            for key, stats in items.items():
+                key = key.replace('\\', '\\\\').replace('"', '\\"')
+                for q in REPORT_QUANTILES:
+                    value = stats[f'p{round(q * 100)}_ms'] / 1000
+                    lines.append(f'{prefix}_{name}{{{label}="{key}",quantile="{q}"}} {value:.6g}')
+                lines.append(f'{prefix}_{name}_sum{{{label}="{key}"}} {stats["total_s"]:.6g}')
+                lines.append(f'{prefix}_{name}_count{{{label}="{key}"}} {stats["count"]}')
+
+        summary('stage_seconds', "Time spent per pipeline stage", 'stage', report['stages'])
+        summary('host_fetch_seconds', "HTTP fetch latency per host", 'host', report['hosts'])
+
+        lines.append(f"# HELP {prefix}_http_responses_total HTTP responses by status")
+        lines.append(f"# TYPE {prefix}_http_responses_total counter")
+        for status, n in report['http_status'].items():
+            lines.append(f'{prefix}_http_responses_total{{status="{status}"}} {n}')
+        for name, n in report['counters'].items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {n}")
+        lines.append(f"# TYPE {prefix}_run_elapsed_seconds gauge")
+        lines.append(f"{prefix}_run_elapsed_seconds {report['elapsed_s']:.6g}")
+        return '\n'.join(lines) + '\n'
+
+    def save(self, path):
+        """Write the report as JSON, or Prometheus text for a .prom path"""
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith('.prom'):
+                f.write(self.prometheus())
+            else:
+                json.dump(self.report(), f, indent=2)
+
+
+class ArticleProfile:
+    """Wall and CPU seconds per profiled stage of one article"""
+
+    __slots__ = ('url_id', 'stages', 'text')
+
+    def __init__(self, url_id):
+        self.url_id = url_id
+        self.stages = {}
+        self.text = None
+
+    def measure(self, stage, func, *args):
+        """Call func(*args), charging its wall and thread CPU time to stage"""
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            return func(*args)
+        finally:
+            self.stages[stage] = (time.perf_counter() - wall, time.thread_time() - cpu)
+
+    @property
+    def wall(self):
+        """Total wall seconds over the profiled stages"""
+        return sum(wall for wall, _ in self.stages.values())
+
+
+class ArticleProfiler:
+    """
+    Opt-in per-article profiling
+
+    Records wall and CPU time of extract_article_text and of each metric
+    function for every article, flags articles (and stages) slower than
+    outlier_factor times the median, and keeps the texts of the `slowest`
+    articles. report() prints the summary; with a profile_dir it also
+    writes articles.csv and re-scores the slowest texts under cProfile
+    (.pstats) and a stack tracer (.folded, for flamegraph.pl/speedscope).
+    Scoring runs in-thread while profiling so the metric times are visible.
+    """
+
+    STAGES = ['extract_article_text', 'tokenize', 'calculate_sentiment_scores',
+              'calculate_readability_metrics', 'count_personal_pronouns']
+
+    def __init__(self, slowest=10, outlier_factor=5.0, profile_dir=None):
+        self.slowest = slowest
+        self.outlier_factor = outlier_factor
+        self.profile_dir = profile_dir
+        self.records = []
+        self._slowest = []     # min-heap of (wall, seq, url_id, text)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def start(self, url_id):
+        """Begin profiling an article on this thread"""
+        profile = self._local.profile = ArticleProfile(url_id)
+        return profile
+
+    def active(self):
+        """The article being profiled on this thread, if any"""
+        return getattr(self._local, 'profile', None)
+
+    def finish(self, profile):
+        """Store a finished article's timings"""
+        self._local.profile = None
+        row = (str(profile.url_id), {stage: profile.stages.get(stage, (0.0, 0.0)) for stage in self.STAGES})
+        wall = profile.wall
+        with self._lock:
+            self.records.append(row)
+            if profile.text and self.slowest:
+                entry = (wall, len(self.records), row[0], profile.text)
+                if len(self._slowest) < self.slowest:
+                    heapq.heappush(self._slowest, entry)
+                elif wall > self._slowest[0][0]:
+                    heapq.heapreplace(self._slowest, entry)
+
+    def outliers(self):
+        """(url_id, total wall, slow stages) for articles above outlier_factor x the median"""
+        if not self.records:
+            return []
+        walls = np.array([[stages[stage][0] for stage in self.STAGES] for _, stages in self.records])
+        totals = walls.sum(axis=1)
+        stage_limits = np.median(walls, axis=0) * self.outlier_factor
+        total_limit = np.median(totals) * self.outlier_factor
+        flagged = []
+        for (url_id, _), total, row in zip(self.records, totals, walls):
+            slow = [stage for stage, wall, limit in zip(self.STAGES, row, stage_limits) if limit and wall > limit]
+            if total > total_limit or slow:
+                flagged.append((url_id, float(total), slow))
+        return sorted(flagged, key=lambda item: -item[1])
+
+    def report(self, analyzer):
+        """Print the profile summary and write profile_dir artifacts"""
+        if not self.records:
+            return
+        print(f"\n=== PROFILE ({len(self.records)} articles) ===")
+        for i, stage in enumerate(self.STAGES):
+            walls = np.array([stages[stage][0] for _, stages in self.records]) * 1000
+            cpus = np.array([stages[stage][1] for _, stages in self.records]) * 1000
+            print(f"{stage}: wall p50={np.median(walls):.2f}ms p99={np.quantile(walls, 0.99):.2f}ms "
+                  f"max={walls.max():.2f}ms, cpu p50={np.median(cpus):.2f}ms total={cpus.sum():.0f}ms")
+
+        outliers = self.outliers()
+        print(f"Outliers (> {self.outlier_factor:g}x median): {len(outliers)}")
+        for url_id, total, slow in outliers[:self.slowest]:
+            print(f"  {url_id}: {total * 1000:.1f}ms, slow stages: {', '.join(slow) or '-'}")
+
+        if not self.profile_dir:
+            return
+        os.makedirs(self.profile_dir, exist_ok=True)
+        with open(os.path.join(self.profile_dir, 'articles.csv'), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['URL_ID'] + [f'{stage} {kind}' for stage in self.STAGES for kind in ('wall', 'cpu')])
+            for url_id, stages in self.records:
+                writer.writerow([url_id] + [f'{value:.6f}' for stage in self.STAGES for value in stages[stage]])
+
+        # Re-score the slowest texts with the profilers attached, so only
+        # they pay the profiling overhead
+        for rank, (wall, _, url_id, text) in enumerate(sorted(self._slowest, reverse=True), 1):
+            safe_id = re.sub(r'[^\w.-]', '_', url_id)
+            name = os.path.join(self.profile_dir, f"{rank:02d}_{safe_id}")
+            profiler = cProfile.Profile()
+            profiler.runcall(analyzer.analyze_text, text)
+            profiler.dump_stats(name + '.pstats')
+            with open(name + '.folded', 'w', encoding='utf-8') as f:
+                for stack, seconds in folded_stacks(analyzer.analyze_text, text).items():
+                    f.write(f"{stack} {max(1, round(seconds * 1e6))}\n")
+        print(f"Profiles of the {len(self._slowest)} slowest articles written to {self.profile_dir}")
+
+
+def folded_stacks(func, *args):
+    """Run func(*args) under a stack tracer; return {'a;b;c': self seconds} (folded stack format)"""
+    stacks = Counter()
+    stack = []      # [frame name, start, time spent in children]
+    clock = time.perf_counter
+
+    def tracer(frame, event, arg):
+        if event == 'call':
+            code = frame.f_code
+            stack.append([f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})",
+                          clock(), 0.0])
+        elif event == 'c_call':
+            stack.append([getattr(arg, '__qualname__', None) or repr(arg), clock(), 0.0])
+        elif stack:
+            elapsed = clock() - stack[-1][1]
+            path = ';'.join(name for name, _, _ in stack)
+            stacks[path] += elapsed - stack.pop()[2]
+            if stack:
+                stack[-1][2] += elapsed
+
+    sys.setprofile(tracer)
+    try:
+        func(*args)
+    finally:
+        sys.setprofile(None)
+    return stacks
+
+
+def _json_default(value):
+    """json.dumps fallback for NumPy scalars and other odd values"""
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+class CheckpointJournal:
+    """
+    Append-only JSONL journal of per-article results
+
+    Every finished article is written as one line and flushed right away, so
+    an interrupted run can resume from the journal. Each checkpoint costs a
+    single append, no matter how many results came before it. Lines are
+    stamped with the analyzer's scoring_key, and load() skips lines scored
+    with other word lists or settings.
+    """
+
+    KEY_FIELD = '_scoring_key'
+
+    def __init__(self, path, scoring_key=None):
+        self.path = path
+        self.scoring_key = scoring_key
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Return the latest up-to-date recorded result for each URL_ID"""
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+
+        torn = False
+        stale = set()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                torn = not line.endswith('\n')
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A crash mid-write can leave a truncated last line
+                    continue
+                url_id = str(record['URL_ID'])
+                if record.pop(self.KEY_FIELD, None) != self.scoring_key:
+                    records.pop(url_id, None)
+                    stale.add(url_id)
+                    continue
+                records[url_id] = record
+                stale.discard(url_id)
+
+        # Terminate a torn last line so new appends start on a fresh line
+        if torn:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n')
+        if stale:
+            print(f"{len(stale)} articles in {self.path} were scored with other word lists "
+                  f"or settings and will be analyzed again")
+        return records
+
+    @staticmethod
+    def is_complete(record, url):
+        """Whether a recorded result can be reused for this URL (failures are retried)"""
+        return bool(record) and record['URL'] == url and record['WORD COUNT'] > 0
+
+    def append(self, result):
+        """Record one article result"""
+        line = json.dumps(dict(result, **{self.KEY_FIELD: self.scoring_key}), default=_json_default)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+# MinHash permutations are a*x + b mod a Mersenne prime; a fixed seed keeps
+# signatures comparable across runs
+MINHASH_PRIME = (1 << 31) - 1
+MINHASH_SEED = 20241017
+DUPLICATE_INDEX_VERSION = 1
+
+
+class DuplicateIndex:
+    """
+    Exact and near-duplicate detection over extracted article text
+
+    Exact copies are matched by a content hash. Near-duplicates are found
+    with MinHash signatures of word shingles, bucketed by LSH banding: only
+    articles sharing a band are compared, and a candidate whose estimated
+    Jaccard similarity reaches `threshold` is a duplicate. Every indexed
+    article keeps its metrics, so a duplicate reuses them instead of being
+    scored again. With a path, the index is saved to a JSON file and loaded
+    again by the next run, as long as the word lists are unchanged.
+    """
+
+    def __init__(self, path=None, num_perm=64, bands=16, shingle_size=5, threshold=0.8):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        rng = np.random.RandomState(MINHASH_SEED)
+        self._a = rng.randint(1, MINHASH_PRIME, num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, MINHASH_PRIME, num_perm, dtype=np.int64).astype(np.uint64)
+
+        self.scoring_key = None
+        self.entries = {}      # url_id -> {'id', 'url', 'digest', 'signature', 'metrics'}
+        self.by_digest = {}    # content hash -> url_id
+        self.buckets = {}      # (band, band bytes) -> set of url_ids
+        self._lock = threading.Lock()
+
+    def params(self):
+        """Settings that must match for a saved index to be reused"""
+        return {'num_perm': self.num_perm, 'bands': self.bands, 'shingle_size': self.shingle_size}
+
+    @staticmethod
+    def digest(text):
+        """Exact-match content hash"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def signature(self, text):
+        """MinHash signature over the text's lower-cased word shingles"""
+        words = text.lower().split()
+        k = self.shingle_size
+        shingles = {zlib.crc32(' '.join(words[i:i + k]).encode('utf-8'))
+                    for i in range(max(1, len(words) - k + 1))}
+        x = np.fromiter(shingles, dtype=np.uint64, count=len(shingles)) % MINHASH_PRIME
+
+        # Hash in column chunks so long articles don't build a huge matrix
+        signature = np.full(self.num_perm, MINHASH_PRIME, dtype=np.uint64)
+        for start in range(0, len(x), 4096):
+            chunk = x[start:start + 4096]
+            hashed = (self._a[:, None] * chunk + self._b[:, None]) % MINHASH_PRIME
+            np.minimum(signature, hashed.min(axis=1), out=signature)
+        return signature
+
+    def band_keys(self, signature):
+        """LSH bucket keys: one per band of the signature"""
+        rows = signature.reshape(self.bands, -1)
+        return [(band, rows[band].tobytes()) for band in range(self.bands)]
+
+    def match(self, text, url_id=None):
+        """Return (indexed entry or None, digest, signature) for an article text
+
+        The signature is None when the text is an exact copy, since it is
+        only needed to index a new article. The article's own entry
+        (url_id) only matches exactly: an edited article is scored again.
+        """
+        digest = self.digest(text)
+        with self._lock:
+            original = self.by_digest.get(digest)
+            if original is not None:
+                return self.entries[original], digest, None
+
+        signature = self.signature(text)
+        best, best_similarity = None, self.threshold
+        with self._lock:
+            candidates = set()
+            for key in self.band_keys(signature):
+                candidates.update(self.buckets.get(key, ()))
+            candidates.discard(str(url_id))
+            for candidate in candidates:
+                entry = self.entries[candidate]
+                similarity = np.count_nonzero(entry['signature'] == signature) / self.num_perm
+                if similarity >= best_similarity:
+                    best, best_similarity = entry, similarity
+        return best, digest, signature
+
+    def add(self, url_id, url, digest, signature, metrics):
+        """Index a scored article under its URL_ID, replacing any older entry"""
+        entry = {'id': str(url_id), 'url': url, 'digest': digest,
+                 'signature': signature, 'metrics': metrics}
+        with self._lock:
+            self._remove(entry['id'])
+            self.entries[entry['id']] = entry
+            self.by_digest.setdefault(digest, entry['id'])
+            for key in self.band_keys(signature):
+                self.buckets.setdefault(key, set()).add(entry['id'])
+
+    def _remove(self, url_id):
+        entry = self.entries.pop(url_id, None)
+        if entry is None:
+            return
+        if self.by_digest.get(entry['digest']) == url_id:
+            del self.by_digest[entry['digest']]
+        for key in self.band_keys(entry['signature']):
+            self.buckets.get(key, set()).discard(url_id)
+
+    def load(self, scoring_key):
+        """Load the saved index, unless it was built with other word lists or settings"""
+        self.scoring_key = scoring_key
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read duplicate index {self.path}: {e}")
+            return
+        if (saved.get('version') != DUPLICATE_INDEX_VERSION or saved.get('params') != self.params()
+                or saved.get('scoring_key') != scoring_key):
+            print(f"Duplicate index {self.path} is out of date; starting a new one")
+            return
+        for entry in saved['entries']:
+            self.add(entry['id'], entry['url'], entry['digest'],
+                     np.array(entry['signature'], dtype=np.uint64), entry['metrics'])
+        print(f"Loaded {len(self.entries)} articles from duplicate index {self.path}")
+
+    def save(self):
+        """Write the index to its path atomically"""
+        if not self.path:
+            return
+        with self._lock:
+            entries = [dict(entry, signature=entry['signature'].tolist())
+                       for entry in self.entries.values()]
+        saved = {'version': DUPLICATE_INDEX_VERSION, 'params': self.params(),
+                 'scoring_key': self.scoring_key, 'entries': entries}
+        with open(self.path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(saved, f, default=_json_default)
+        os.replace(self.path + '.tmp', self.path)
+
+
+RESULT_COLUMNS = [
+    'URL_ID', 'URL', 'POSITIVE SCORE', 'NEGATIVE SCORE', 'POLARITY SCORE',
+    'SUBJECTIVITY SCORE', 'AVG SENTENCE LENGTH', 'PERCENTAGE OF COMPLEX WORDS',
+    'FOG INDEX', 'AVG NUMBER OF WORDS PER SENTENCE', 'COMPLEX WORD COUNT',
+    'WORD COUNT', 'SYLLABLE PER WORD', 'PERSONAL PRONOUNS', 'AVG WORD LENGTH'
+]
+# Integer-valued metric columns; every other metric is a float score
+COUNT_COLUMNS = ['POSITIVE SCORE', 'NEGATIVE SCORE', 'COMPLEX WORD COUNT',
+                 'WORD COUNT', 'PERSONAL PRONOUNS']
+# Extra column written when duplicate detection is on: the URL_ID whose
+# metrics were reused, or '' for an original article
+DUPLICATE_COLUMN = 'DUPLICATE OF'
+# Extra column written with record_failures: why the row has no metrics
+FAILURE_COLUMN = 'FAILURE REASON'
+EXTRA_COLUMNS = [DUPLICATE_COLUMN, FAILURE_COLUMN]
+TEXT_COLUMNS = ['URL_ID', 'URL'] + EXTRA_COLUMNS
+
+
+def output_columns(columns):
+    """RESULT_COLUMNS, plus the duplicate/failure columns when the rows carry them"""
+    return RESULT_COLUMNS + [column for column in EXTRA_COLUMNS if column in columns]
+
+
+def result_schema(columns=RESULT_COLUMNS):
+    """Arrow schema for result rows: string ids, int32 counts, float32 scores"""
+    import pyarrow as pa
+
+    return pa.schema([
+        (column, pa.string() if column in TEXT_COLUMNS else
+         pa.int32() if column in COUNT_COLUMNS else pa.float32())
+        for column in columns
+    ])
+
+
+class ResultTable:
+    """
+    Result rows held as preallocated column buffers
+
+    Metric columns are NumPy arrays (int32 counts, float64 scores) and the
+    id/URL columns are object arrays, so a stored row costs a few dozen
+    bytes instead of a 15-key dict. Rows are filled in place by index or
+    appended (the buffers double when full), and to_dataframe() builds the
+    DataFrame straight from the columns.
+    """
+
+    def __init__(self, size=0, columns=RESULT_COLUMNS):
+        self.columns = columns
+        self.size = size
+        self._data = {column: self._buffer(column, max(size, 16)) for column in columns}
+
+    @staticmethod
+    def _buffer(column, capacity):
+        if column in TEXT_COLUMNS:
+            return np.full(capacity, '', dtype=object)
+        return np.zeros(capacity, dtype=np.int32 if column in COUNT_COLUMNS else np.float64)
+
+    def __len__(self):
+        return self.size
+
+    def __setitem__(self, index, row):
+        for column, values in self._data.items():
+            values[index] = row.get(column, '') if column in TEXT_COLUMNS else row[column]
+
+    def __getitem__(self, index):
+        return {column: values[index] for column, values in self._data.items()}
+
+    def append(self, row):
+        """Add a row at the end, growing the buffers when they are full"""
+        capacity = len(self._data[self.columns[0]])
+        if self.size == capacity:
+            for column, values in self._data.items():
+                grown = self._buffer(column, 2 * capacity)
+                grown[:capacity] = values
+                self._data[column] = grown
+        self[self.size] = row
+        self.size += 1
+
+    def to_dataframe(self):
+        """DataFrame of the filled rows, in column order"""
+        return pd.DataFrame({column: values[:self.size] for column, values in self._data.items()},
+                            columns=self.columns, copy=False)
+
+
+class ResultWriter:
+    """Base class for streaming result writers: write() rows as they arrive, then close()"""
+
+    def __init__(self, path, columns=RESULT_COLUMNS):
+        self.path = path
+        self.columns = columns
+        self.rows_written = 0
+
+    def write(self, row):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvResultWriter(ResultWriter):
+    """Append result rows to a CSV file"""
+
+    def __init__(self, path, columns=RESULT_COLUMNS):
+        super().__init__(path, columns)
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def write(self, row):
+        self._writer.writerow(row)
+        self.rows_written += 1
+
+    def close(self):
+        self._file.close()
+
+
+class JsonlResultWriter(ResultWriter):
+    """Append result rows to a JSON-lines file"""
+
+    def __init__(self, path, columns=RESULT_COLUMNS):
+        super().__init__(path, columns)
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, row):
+        self._file.write(json.dumps(row, default=_json_default) + '\n')
+        self.rows_written += 1
+
+    def close(self):
+        self._file.close()
+
+
+class XlsxResultWriter(ResultWriter):
+    """Stream result rows into a write-only openpyxl workbook"""
+
+    def __init__(self, path, columns=RESULT_COLUMNS):
+        from openpyxl import Workbook
+
+        super().__init__(path, columns)
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet('Sheet1')
+        self._sheet.append(columns)
+
+    def write(self, row):
+        self._sheet.append([row.get(column, '') for column in self.columns])
+        self.rows_written += 1
+
+    def close(self):
+        self._workbook.save(self.path)
+
+
+class ParquetResultWriter(ResultWriter):
+    """Buffer result rows and flush them to a Parquet file one row group at a time"""
+
+    def __init__(self, path, columns=RESULT_COLUMNS, row_group_size=10000):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        super().__init__(path, columns)
+        self._pa = pa
+        self.schema = result_schema(columns)
+        self._writer = pq.ParquetWriter(path, self.schema)
+        self.row_group_size = row_group_size
+        self._buffer = []
+
+    def write(self, row):
+        self._buffer.append(row)
+        self.rows_written += 1
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered rows out as one row group"""
+        if not self._buffer:
+            return
+        columns = {
+            column: [str(row.get(column, '')) for row in self._buffer] if column in TEXT_COLUMNS
+            else [row[column] for row in self._buffer]
+            for column in self.columns
+        }
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self.schema))
+        self._buffer = []
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+
+RESULT_WRITERS = {
+    '.csv': CsvResultWriter,
+    '.jsonl': JsonlResultWriter,
+    '.xlsx': XlsxResultWriter,
+    '.parquet': ParquetResultWriter,
+}
+
+
+class ExcelOutputBackend:
+    """Write all results to one Excel sheet (the original Output.xlsx format)"""
+
+    def save(self, results_df, path):
+        results_df.to_excel(path, index=False)
+
+
+class CsvOutputBackend:
+    """Write all results to one CSV file"""
+
+    def save(self, results_df, path):
+        results_df.to_csv(path, index=False)
+
+
+class ParquetOutputBackend:
+    """
+    Write results as a typed Parquet file or dataset
+
+    Counts are stored as int32 and scores as float32 (see result_schema).
+    With partition_by_date, path is a dataset directory and each run lands
+    in its own run_date=YYYY-MM-DD partition.
+    """
+
+    def __init__(self, partition_by_date=False, run_date=None):
+        self.partition_by_date = partition_by_date
+        self.run_date = run_date
+
+    def save(self, results_df, path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns = output_columns(results_df.columns)
+        results_df = results_df.astype({column: str for column in TEXT_COLUMNS if column in columns})
+        table = pa.Table.from_pandas(results_df[columns], schema=result_schema(columns),
+                                     preserve_index=False)
+        if not self.partition_by_date:
+            pq.write_table(table, path)
+            return
+
+        run_date = self.run_date or time.strftime('%Y-%m-%d')
+        table = table.append_column('run_date', pa.array([run_date] * len(table), pa.string()))
+        pq.write_to_dataset(table, path, partition_cols=['run_date'],
+                            basename_template=f"part-{int(time.time())}-{{i}}.parquet")
+
+
+OUTPUT_BACKENDS = {
+    'excel': ExcelOutputBackend,
+    'csv': CsvOutputBackend,
+    'parquet': ParquetOutputBackend,
+}
+
+
+def get_output_backend(backend, output_file):
+    """Resolve a backend name, instance or None (pick by output file extension)"""
+    if backend is None:
+        extension = os.path.splitext(output_file)[1].lower()
+        backend = {'.csv': 'csv', '.parquet': 'parquet'}.get(extension, 'excel')
+    if isinstance(backend, str):
+        if backend not in OUTPUT_BACKENDS:
+            raise ValueError(f"Unknown output backend: {backend} (expected one of {', '.join(OUTPUT_BACKENDS)})")
+        backend = OUTPUT_BACKENDS[backend]()
+    return backend
+
+
+def open_result_writer(path, columns=RESULT_COLUMNS):
+    """Open a streaming result writer chosen by the output file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in RESULT_WRITERS:
+        raise ValueError(f"Unsupported output format: {extension} (expected one of {', '.join(RESULT_WRITERS)})")
+    return RESULT_WRITERS[extension](path, columns)
+
 
 class ComprehensiveNLPAnalyzer:
     """
@@ -20,24 +1844,146 @@ class ComprehensiveNLPAnalyzer:
     5. Outputs results in specified Excel format
     """
 
-    def __init__(self):
+    def __init__(self, workers=1, host_delay=0.5, max_per_host=1, host_delays=None,
+                 pool_size=10, cache_dir=None, cache_max_bytes=512 * 1024 * 1024,
+                 offline=False, analysis_processes=0, extraction_engine='soup',
+                 extraction_profiles=None, learn_profiles_after=0, strip_boilerplate=False, boilerplate_templates=None,
+                 detect_duplicates=False, duplicate_index=None, instrument=False, metrics_report=None,
+                 profile=False, profile_dir=None, profile_slowest=10, outlier_factor=5.0,
+                 fetch_policy=None, circuit_breaker=None, run_deadline=None, record_failures=False,
+                 sentence_mode='compat'):
         self.positive_words = set()
         self.negative_words = set()
         self.stopwords = set()
+        self._token_classes = None
+        self._token_classes_key = None
+
+        # Fetch engine: worker threads plus per-host pacing (host_delays maps
+        # a host name to its own delay, overriding host_delay for that host)
+        self.workers = max(1, workers)
+        self.rate_limiter = HostRateLimiter(host_delay, max_per_host, host_delays)
+
+        # Retries with backoff, per-host circuit breakers and an optional
+        # deadline (seconds) for a whole run
+        self.fetch_policy = fetch_policy or FetchPolicy()
+        self.breaker = circuit_breaker or CircuitBreaker()
+        self.run_deadline = run_deadline
+        self.deadline = None
+
+        # Shared keep-alive session; pool_size is the connection pool per host
+        self.session = self.create_session(pool_size)
+
+        # Optional response cache; offline mode serves only from the cache
+        self.cache = ResponseCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.offline = offline
+        if offline and self.cache is None:
+            raise ValueError("offline mode requires a cache_dir")
+
+        # 'soup' builds a full BeautifulSoup tree; 'fast' gets the same text
+        # from a single streaming pass over the document
+        if extraction_engine not in ('soup', 'fast'):
+            raise ValueError(f"Unknown extraction engine: {extraction_engine}")
+        self.extraction_engine = extraction_engine
+
+        # Per-host selector profiles; extraction_profiles maps a host to
+        # {'title': selector, 'content': selector}; learn_profiles_after=N
+        # also adopts a selector once it has won N times for a host
+        self.profiles = ExtractionProfiles(extraction_profiles, learn_profiles_after)
 
-    def load_word_lists(self):
-        """Load all word lists and stopwords from files"""
+        # Drop per-host template text (menus, bylines, related links) before
+        # scoring; boilerplate_templates is a JSON file that keeps the learned
+        # templates between runs
+        self.boilerplate = (BoilerplateFilter(boilerplate_templates)
+                            if strip_boilerplate or boilerplate_templates else None)
+
+        # Exact/near-duplicate articles reuse the metrics of the first copy;
+        # duplicate_index is a JSON file that keeps the index between runs
+        self.duplicates = DuplicateIndex(duplicate_index) if detect_duplicates or duplicate_index else None
+
+        # Stage timers and counters (see RunMetrics); metrics_report is a .json
+        # or .prom path the report is written to when a run finishes
+        self.run_metrics = RunMetrics() if instrument or metrics_report else None
+        self.metrics_report = metrics_report
+
+        # Add a FAILURE REASON column saying why a row has no metrics
+        self.record_failures = record_failures
+
+        # Per-article, per-metric wall/CPU profiling (see ArticleProfiler)
+        self.profiler = (ArticleProfiler(profile_slowest, outlier_factor, profile_dir)
+                         if profile or profile_dir else None)
+
+        # Sentence counting for readability (see SentenceSegmenter); 'compat'
+        # keeps the historical counts, 'abbreviations' doesn't split on
+        # abbreviations, initials or decimals
+        self.segmenter = sentence_segmenter(sentence_mode)
+
+        # CPU scoring can be moved to worker processes (0 = score in-thread);
+        # the pool is started by process_all_articles or start_analysis_pool
+        self.analysis_processes = analysis_processes
+        self.analysis_pool = None
+
+    def create_session(self, pool_size=10):
+        """Create a pooled keep-alive HTTP session with compression enabled
+
+        pool_size caps the kept-alive connections per host. The number of
+        host pools cached stays at requests' default, so a small pool_size
+        doesn't evict other hosts' pools when a run moves between hosts.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        # ACCEPT_ENCODING lists gzip/deflate plus br (and zstd) when the
+        # decoders are installed, so we never ask for bodies we can't decode
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        return session
+
+    def load_word_lists(self, data_dir=DATA_DIR, compiled=True):
+        """Load all word lists and stopwords, from the compiled lexicon when it is current
+
+        The compiled lexicon (LEXICON_FILE under data_dir) is rebuilt
+        automatically whenever the size or mtime of a dictionary source no
+        longer matches the stamp in it. compiled=False always parses the
+        text files.
+        """
+        if not compiled:
+            self.read_word_lists(data_dir)
+            return
+
+        lexicon_path = os.path.join(data_dir, LEXICON_FILE)
+        stamp = lexicon_source_stamp(data_dir)
+        lexicon = read_lexicon(lexicon_path, stamp)
+        if lexicon:
+            self.positive_words, self.negative_words, self.stopwords = lexicon
+            print(f"Loaded {len(self.positive_words)} positive, {len(self.negative_words)} negative "
+                  f"and {len(self.stopwords)} stopwords from {lexicon_path}")
+            return
+
+        self.read_word_lists(data_dir)
+        try:
+            write_lexicon(lexicon_path, stamp,
+                          self.positive_words, self.negative_words, self.stopwords)
+            print(f"Compiled word lists to {lexicon_path}")
+        except OSError as e:
+            print(f"Could not write {lexicon_path}: {e}")
+
+    def read_word_lists(self, data_dir=DATA_DIR):
+        """Parse all word lists and stopwords from the text files under data_dir"""
 
         # Load positive words
         try:
-            with open("C:/Users/HP/Downloads/NLP Project/MasterDictionary/positive-words.txt", 'r', encoding='utf-8') as f:
+            with open(os.path.join(data_dir, POSITIVE_WORDS_FILE), 'r', encoding='utf-8') as f:
                 self.positive_words = set(word.strip().lower() for word in f.readlines() if word.strip())
             print(f"Loaded {len(self.positive_words)} positive words")
         except Exception as e:
             print(f"Error loading positive words: {e}")
 
         # Load negative words
-        paste_files = ["C:/Users/HP/Downloads/NLP Project/MasterDictionary/negative-words.txt"]
+        paste_files = [os.path.join(data_dir, NEGATIVE_WORDS_FILE)]
         for paste_file in paste_files:
             try:
                 with open(paste_file, 'r', encoding='utf-8') as f:
@@ -52,11 +1998,7 @@ class ComprehensiveNLPAnalyzer:
         print(f"Loaded {len(self.negative_words)} negative words")
 
         # Load stopwords
-        stopword_files = [
-            "C:/Users/HP/Downloads/NLP Project/StopWords/StopWords_Auditor.txt", "C:/Users/HP/Downloads/NLP Project/StopWords/StopWords_DatesandNumbers.txt",
-            "C:/Users/HP/Downloads/NLP Project/StopWords/StopWords_Generic.txt", "C:/Users/HP/Downloads/NLP Project/StopWords/StopWords_GenericLong.txt",
-            "C:/Users/HP/Downloads/NLP Project/StopWords/StopWords_Geographic.txt", "C:/Users/HP/Downloads/NLP Project/StopWords/StopWords_Names.txt"
-        ]
+        stopword_files = [os.path.join(data_dir, 'StopWords', name) for name in STOPWORD_FILES]
 
         for stop_file in stopword_files:
             try:
@@ -67,99 +2009,254 @@ class ComprehensiveNLPAnalyzer:
                 print(f"Error loading {stop_file}: {e}")
 
         # Add currency stopwords
-        currency_stopwords = [
-            'AFGHANI', 'ARIARY', 'BAHT', 'BALBOA', 'BIRR', 'BOLIVAR', 'BOLIVIANO', 
-            'CEDI', 'COLON', 'CÓRDOBA', 'DALASI', 'DENAR', 'DINAR', 'DIRHAM', 
-            'DOBRA', 'DONG', 'DRAM', 'ESCUDO', 'EURO', 'FLORIN', 'FORINT', 
-            'GOURDE', 'GUARANI', 'GULDEN', 'HRYVNIA', 'KINA', 'KIP', 'KORUNA',
-            'KRONA', 'KRONE', 'KROON', 'KUNA', 'KWACHA', 'KWANZA', 'KYAT',
-            'LARI', 'LATS', 'LEK', 'LEMPIRA', 'LEONE', 'LEU', 'LEV', 'LILANGENI',
-            'LIRA', 'LITAS', 'LOTI', 'MANAT', 'METICAL', 'NAIRA', 'NAKFA',
-            'SHEQEL', 'NGULTRUM', 'NUEVO', 'SOL', 'OUGUIYA', 'PATACA', 'PESO',
-            'POUND', 'PULA', 'QUETZAL', 'RAND', 'REAL', 'RENMINBI', 'RIAL',
-            'RIEL', 'RINGGIT', 'RIYAL', 'RUBLE', 'RUFIYAA', 'RUPEE', 'RUPIAH',
-            'SHILLING', 'SOM', 'SOMONI', 'TAKA', 'TALA', 'TENGE', 'TUGRIK',
-            'VATU', 'WON', 'YEN', 'ZLOTY'
-        ]
-
-        self.stopwords.update(word.lower() for word in currency_stopwords)
+        self.stopwords.update(word.lower() for word in CURRENCY_STOPWORDS)
         print(f"Total stopwords loaded: {len(self.stopwords)}")
 
-    def extract_article_text(self, url):
-        """Extract article text from URL using BeautifulSoup"""
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+    def fetch_html(self, url):
+        """Download raw HTML for a URL, revalidating against the cache if enabled"""
+        cached = self.cache.get(url) if self.cache else None
+        if self.offline:
+            return self.offline_body(cached)
+        headers = self.revalidation_headers(cached)
+
+        host = urlparse(url).netloc.lower()
+        attempt = 0
+        while True:
+            timeout, probe = self.begin_fetch_attempt(host)
+            status = body = response_headers = first_byte = error = None
+            start = time.perf_counter()
+            try:
+                with self.timer('rate_limit_wait'):
+                    self.rate_limiter.acquire(url)
+                start = time.perf_counter()
+                try:
+                    with self.session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                        body = self.read_body(response) if 200 <= response.status_code < 300 else b''
+                        status, response_headers = response.status_code, response.headers
+                        first_byte = response.elapsed.total_seconds()
+                finally:
+                    self.rate_limiter.release(host)
+            except BaseException as e:
+                error = e
+            delay = self.end_fetch_attempt(host, attempt, probe, time.perf_counter() - start,
+                                           status, body, response_headers, error, first_byte)
+            if delay is None:
+                break
+            self.count('retries')
+            self.wait_before_retry(delay)
+            attempt += 1
 
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+        return self.finish_fetch(url, cached, status, body, response_headers)
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+    def offline_body(self, cached):
+        """The cached body in offline mode; a miss raises LookupError"""
+        if cached is None:
+            raise LookupError("not in response cache (offline mode)")
+        self.count('cache_hits')
+        return cached[1]
 
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+    @staticmethod
+    def revalidation_headers(cached):
+        """Conditional request headers for a cached response"""
+        headers = {}
+        if cached:
+            meta = cached[0]
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        return headers
 
-            # Extract title
-            title = ""
-            for tag in ['h1', 'title', '.entry-title', '.post-title']:
-                if tag.startswith('.'):
-                    element = soup.find(class_=tag[1:])
-                else:
-                    element = soup.find(tag)
-                if element:
-                    title = element.get_text().strip()
-                    break
+    def begin_fetch_attempt(self, host):
+        """Check the host's circuit and the run deadline before an attempt, return (timeout, probe)"""
+        probe = self.breaker.check(host)
+        try:
+            return self.request_timeout(), probe
+        except DeadlineExceeded:
+            self.breaker.release(host, probe)
+            raise
 
-            # Extract article content
-            article_text = ""
-            content_selectors = [
-                'article', '.post-content', '.entry-content', 
-                '.article-content', '.content', 'main'
-            ]
+    def end_fetch_attempt(self, host, attempt, probe, seconds, status=None, body=b'', headers=None,
+                          error=None, first_byte_seconds=None, retryable=RETRYABLE_ERRORS):
+        """
+        Record how a download attempt ended; return the delay before the next one, or None when done
 
-            for selector in content_selectors:
-                if selector.startswith('.'):
-                    elements = soup.find_all(class_=selector[1:])
+        error is the exception the attempt raised, if any. Errors that are
+        not retried, or are out of retries, are re-raised here. Either way
+        the breaker hears about the outcome and a half-open trial is ended.
+        """
+        try:
+            if error is None:
+                self.record_response(host, status, len(body), seconds, first_byte_seconds)
+                if status >= 500:
+                    self.breaker.record_failure(host)
                 else:
-                    elements = soup.find_all(selector)
+                    self.breaker.record_success(host)
+                if status not in self.fetch_policy.retry_statuses:
+                    return None
+                return self.fetch_policy.retry_delay(attempt, headers.get('Retry-After'))
 
-                if elements:
-                    article_text = ' '.join([elem.get_text() for elem in elements])
-                    break
+            if isinstance(error, ResponseRejected):
+                self.record_response(host, 'rejected', 0, seconds)
+                self.count('downloads_aborted')
+            elif isinstance(error, Exception):
+                self.record_response(host, 'error', 0, seconds)
+                if isinstance(error, retryable):
+                    self.breaker.record_failure(host)
+                    delay = self.fetch_policy.retry_delay(attempt)
+                    if delay is not None:
+                        return delay
+            raise error
+        finally:
+            self.breaker.release(host, probe)
+
+    def finish_fetch(self, url, cached, status, body, headers):
+        """Body of the final response: the cached copy on 304, HTTPError on an error status"""
+        if status == 304 and cached:
+            self.count('cache_revalidated')
+            return cached[1]
+        if status >= 400:
+            response = requests.Response()
+            response.status_code = status
+            response.url = url
+            raise requests.HTTPError(f"{status} Error for url: {url}", response=response)
+
+        if self.cache:
+            self.cache.put(url, body, headers.get('ETag'), headers.get('Last-Modified'))
+        return body
 
-            if not article_text:
-                paragraphs = soup.find_all('p')
-                article_text = ' '.join([p.get_text() for p in paragraphs])
+    def read_body(self, response):
+        """Read a streamed response body, aborting once it breaks the fetch policy's type or size limits"""
+        body = BoundedBody(self.fetch_policy, response.headers)
+        for chunk in response.iter_content(64 * 1024):
+            body.add(chunk)
+        return body.data()
 
-            # Clean text
-            article_text = re.sub(r'\s+', ' ', article_text).strip()
-            title = re.sub(r'\s+', ' ', title).strip()
+    def request_timeout(self):
+        """Timeout for the next request, cut short by the run deadline"""
+        timeout = self.fetch_policy.timeout
+        if self.deadline is None:
+            return timeout
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded("run deadline exceeded")
+        if isinstance(timeout, tuple):
+            return tuple(min(part, remaining) for part in timeout)
+        return min(timeout, remaining)
 
-            return title, article_text
+    def wait_before_retry(self, delay):
+        """Back off before a retry, unless that would run past the deadline"""
+        if self.deadline is not None and time.monotonic() + delay >= self.deadline:
+            raise DeadlineExceeded("run deadline exceeded")
+        time.sleep(delay)
 
+    def start_deadline(self):
+        """Start the run_deadline clock for a new run"""
+        self.deadline = time.monotonic() + self.run_deadline if self.run_deadline else None
+
+    def extract_article_text(self, url):
+        """Extract article text from URL using the configured extraction engine"""
+        title, content, _ = self.extract_article(url)
+        return title, content
+
+    def extract_article(self, url):
+        """extract_article_text that also returns why nothing was extracted ('' on success)"""
+        try:
+            return self.parse_fetched(self.fetch_html(url), url)
         except Exception as e:
-            print(f"Error extracting from {url}: {str(e)}")
-            return "", ""
+            return self.extraction_failed(url, e)
 
-    def count_syllables(self, word):
-        """Count syllables in a word"""
-        word = word.lower()
-        vowels = 'aeiouy'
-        syllable_count = 0
-        prev_was_vowel = False
+    def parse_fetched(self, html, url):
+        """Parse a downloaded page into (title, content, failure reason)"""
+        with self.timer('parse'):
+            title, content = self.parse_article(html, url)
+        return title, content, '' if content else "no article content found"
+
+    @staticmethod
+    def extraction_failed(url, error):
+        """(title, content, failure reason) for a page that could not be fetched or parsed"""
+        print(f"Error extracting from {url}: {str(error)}")
+        return "", "", failure_reason(error)
+
+    def parse_article(self, html, url=None):
+        """Return whitespace-normalized (title, article_text) from raw HTML
+
+        With a URL, the host's extraction profile decides which selectors
+        are tried first, and the winning selectors feed profile learning.
+        """
+        host = urlparse(url).netloc.lower() if url else ''
+        title_selectors = self.profiles.selectors(host, 'title', TITLE_SELECTORS)
+        content_selectors = self.profiles.selectors(host, 'content', CONTENT_SELECTORS)
+
+        if self.extraction_engine == 'fast':
+            parse = self.parse_article_fast
+        else:
+            parse = self.parse_article_soup
+        title, article_text, title_selector, content_selector = parse(html, title_selectors, content_selectors)
+
+        self.profiles.record(host, 'title', title_selector)
+        self.profiles.record(host, 'content', content_selector)
+
+        # Clean text
+        article_text = re.sub(r'\s+', ' ', article_text).strip()
+        title = re.sub(r'\s+', ' ', title).strip()
+
+        return title, article_text
+
+    def soup_select(self, soup, selector, first=False):
+        """Find elements for a 'tag', '.class' or compiled CSS selector"""
+        if SIMPLE_SELECTOR_PATTERN.fullmatch(selector):
+            if selector.startswith('.'):
+                return soup.find(class_=selector[1:]) if first else soup.find_all(class_=selector[1:])
+            return soup.find(selector) if first else soup.find_all(selector)
+
+        compiled = compile_selector(selector)
+        return compiled.select_one(soup) if first else compiled.select(soup)
+
+    def parse_article_soup(self, html, title_selectors=TITLE_SELECTORS, content_selectors=CONTENT_SELECTORS):
+        """Extract (title, content, title selector, content selector) from a full BeautifulSoup tree"""
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        # Extract title
+        title, title_selector = "", None
+        for selector in title_selectors:
+            element = self.soup_select(soup, selector, first=True)
+            if element:
+                title = element.get_text().strip()
+                title_selector = selector
+                break
 
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_was_vowel:
-                syllable_count += 1
-            prev_was_vowel = is_vowel
+        # Extract article content
+        article_text, content_selector = "", None
+        for selector in content_selectors:
+            elements = self.soup_select(soup, selector)
+            if elements:
+                article_text = ' '.join([elem.get_text() for elem in elements])
+                content_selector = selector
+                break
+
+        if not article_text:
+            paragraphs = soup.find_all('p')
+            article_text = ' '.join([p.get_text() for p in paragraphs])
 
-        if word.endswith('e'):
-            syllable_count -= 1
+        return title, article_text, title_selector, content_selector
 
-        return max(1, syllable_count)
+    def parse_article_fast(self, html, title_selectors=TITLE_SELECTORS, content_selectors=CONTENT_SELECTORS):
+        """Extract (title, content, title selector, content selector) in one streaming pass"""
+        if isinstance(html, bytes):
+            html = UnicodeDammit(html, is_html=True).unicode_markup
+        parser = FastArticleParser(title_selectors, content_selectors)
+        parser.feed(html)
+        parser.close()
+        return parser.extract()
+
+    def count_syllables(self, word):
+        """Count syllables in a word"""
+        return syllable_count(word.lower())
 
     def is_complex_word(self, word):
         """Check if word is complex (>2 syllables)"""
@@ -170,26 +2267,74 @@ class ComprehensiveNLPAnalyzer:
         words = re.findall(r'\b\w+\b', text.lower())
         return [word for word in words if word not in self.stopwords]
 
-    def calculate_sentiment_scores(self, text):
-        """Calculate sentiment analysis scores"""
-        cleaned_words = self.clean_text(text)
+    def tokenize(self, text):
+        """Tokenize text once for all metrics"""
+        return TokenStream(text, self.segmenter)
+
+    @property
+    def token_classes(self):
+        """Map of word -> STOPWORD/POSITIVE/NEGATIVE/PRONOUN bitmask
+
+        Rebuilt whenever one of the dictionary sets is replaced or changes size.
+        """
+        key = (id(self.stopwords), len(self.stopwords), id(self.positive_words),
+               len(self.positive_words), id(self.negative_words), len(self.negative_words))
+        if key != self._token_classes_key:
+            classes = {}
+            for words, flag in ((self.stopwords, STOPWORD), (self.positive_words, POSITIVE),
+                                (self.negative_words, NEGATIVE), (PERSONAL_PRONOUNS, PRONOUN)):
+                for word in words:
+                    classes[word] = classes.get(word, 0) | flag
+            self._token_classes = classes
+            self._token_classes_key = key
+        return self._token_classes
 
-        positive_score = sum(1 for word in cleaned_words if word in self.positive_words)
-        negative_score = sum(1 for word in cleaned_words if word in self.negative_words)
+    def count_token_classes(self, tokens):
+        """Return (non-stopword, positive, negative, pronoun) token counts
+
+        Each distinct word is classified with a single lookup in
+        token_classes; positive and negative only count non-stopwords,
+        pronouns count every token.
+        """
+        classes = self.token_classes
+        if tokens.class_counts and tokens.class_counts[0] is classes:
+            return tokens.class_counts[1]
+
+        kept = positive = negative = pronouns = 0
+        for word, freq in tokens.counts.items():
+            flags = classes.get(word, 0)
+            if flags & PRONOUN:
+                pronouns += freq
+            if not flags & STOPWORD:
+                kept += freq
+                if flags & POSITIVE:
+                    positive += freq
+                if flags & NEGATIVE:
+                    negative += freq
+
+        counts = (kept, positive, negative, pronouns)
+        tokens.class_counts = (classes, counts)
+        return counts
+
+    def calculate_sentiment_scores(self, text, tokens=None):
+        """Calculate sentiment analysis scores"""
+        if tokens is None:
+            tokens = self.tokenize(text)
+        cleaned_count, positive_score, negative_score, _ = self.count_token_classes(tokens)
 
         polarity_score = (positive_score - negative_score) / ((positive_score + negative_score) + 0.000001)
-        subjectivity_score = (positive_score + negative_score) / (len(cleaned_words) + 0.000001)
+        subjectivity_score = (positive_score + negative_score) / (cleaned_count + 0.000001)
 
         return positive_score, negative_score, polarity_score, subjectivity_score
 
-    def calculate_readability_metrics(self, text):
+    def calculate_readability_metrics(self, text, tokens=None):
         """Calculate readability and linguistic metrics"""
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        words = re.findall(r'\b\w+\b', text)
+        if tokens is None:
+            tokens = self.tokenize(text)
+        sentence_count = tokens.sentence_count
+        words = tokens.measure_words
 
-        if not sentences or not words:
+        if not sentence_count or not words:
             return {
                 'avg_sentence_length': 0, 'percentage_complex_words': 0,
                 'fog_index': 0, 'avg_words_per_sentence': 0,
@@ -197,17 +2342,24 @@ class ComprehensiveNLPAnalyzer:
                 'syllables_per_word': 0, 'avg_word_length': 0
             }
 
-        complex_words = [word for word in words if self.is_complex_word(word)]
-        complex_word_count = len(complex_words)
+        # Score each distinct word once and weight by frequency
+        complex_word_count = 0
+        total_syllables = 0
+        total_length = 0
+        for word, freq in (tokens.counts if tokens.aligned else Counter(words)).items():
+            syllables = syllable_count(word.lower())
+            total_syllables += syllables * freq
+            total_length += len(word) * freq
+            if syllables > 2:
+                complex_word_count += freq
         word_count = len(words)
 
-        avg_sentence_length = len(words) / len(sentences)
+        avg_sentence_length = len(words) / sentence_count
         percentage_complex_words = (complex_word_count / word_count) * 100
         fog_index = 0.4 * (avg_sentence_length + percentage_complex_words)
 
-        total_syllables = sum(self.count_syllables(word) for word in words)
         syllables_per_word = total_syllables / word_count
-        avg_word_length = sum(len(word) for word in words) / word_count
+        avg_word_length = total_length / word_count
 
         return {
             'avg_sentence_length': avg_sentence_length,
@@ -220,116 +2372,1038 @@ class ComprehensiveNLPAnalyzer:
             'avg_word_length': avg_word_length
         }
 
-    def count_personal_pronouns(self, text):
+    def count_personal_pronouns(self, text, tokens=None):
         """Count personal pronouns"""
-        personal_pronouns = ['i', 'we', 'my', 'ours', 'us']
-        words = re.findall(r'\b\w+\b', text.lower())
-        return sum(1 for word in words if word in personal_pronouns)
+        if tokens is None:
+            tokens = self.tokenize(text)
+        return self.count_token_classes(tokens)[3]
 
-    def analyze_article(self, url_id, url):
-        """Complete analysis of single article"""
-        print(f"Analyzing {url_id}...")
+    def analyze_text(self, text):
+        """Compute all metric columns for one article text"""
+        profile = self.profiler.active() if self.profiler else None
+        if profile is None:
+            tokens = self.tokenize(text)
+            pos_score, neg_score, pol_score, subj_score = self.calculate_sentiment_scores(text, tokens)
+            readability = self.calculate_readability_metrics(text, tokens)
+            pronouns = self.count_personal_pronouns(text, tokens)
+        else:
+            profile.text = text
+            tokens = profile.measure('tokenize', self.tokenize, text)
+            pos_score, neg_score, pol_score, subj_score = profile.measure(
+                'calculate_sentiment_scores', self.calculate_sentiment_scores, text, tokens)
+            readability = profile.measure('calculate_readability_metrics', self.calculate_readability_metrics,
+                                          text, tokens)
+            pronouns = profile.measure('count_personal_pronouns', self.count_personal_pronouns, text, tokens)
 
-        title, content = self.extract_article_text(url)
+        return {
+            'POSITIVE SCORE': pos_score, 'NEGATIVE SCORE': neg_score,
+            'POLARITY SCORE': pol_score, 'SUBJECTIVITY SCORE': subj_score,
+            'AVG SENTENCE LENGTH': readability['avg_sentence_length'],
+            'PERCENTAGE OF COMPLEX WORDS': readability['percentage_complex_words'],
+            'FOG INDEX': readability['fog_index'],
+            'AVG NUMBER OF WORDS PER SENTENCE': readability['avg_words_per_sentence'],
+            'COMPLEX WORD COUNT': readability['complex_word_count'],
+            'WORD COUNT': readability['word_count'],
+            'SYLLABLE PER WORD': readability['syllables_per_word'],
+            'PERSONAL PRONOUNS': pronouns,
+            'AVG WORD LENGTH': readability['avg_word_length']
+        }
 
-        # Save extracted text
-        if content:
-            os.makedirs('extracted_articles', exist_ok=True)
-            with open(f'extracted_articles/{url_id}.txt', 'w', encoding='utf-8') as f:
-                f.write(f"Title: {title}\n\nContent:\n{content}")
+    def analyze_article(self, url_id, url, fetched=None):
+        """Complete analysis of single article
 
-        if content:
-            pos_score, neg_score, pol_score, subj_score = self.calculate_sentiment_scores(content)
-            readability = self.calculate_readability_metrics(content)
-            pronouns = self.count_personal_pronouns(content)
+        fetched is the (title, content, failure reason, extraction time) of
+        an article that was already extracted, so it is not downloaded again;
+        the (wall, CPU) extraction time is None unless profiling.
+        """
+        print(f"Analyzing {url_id}...")
 
-            return {
-                'URL_ID': url_id, 'URL': url,
-                'POSITIVE SCORE': pos_score, 'NEGATIVE SCORE': neg_score,
-                'POLARITY SCORE': pol_score, 'SUBJECTIVITY SCORE': subj_score,
-                'AVG SENTENCE LENGTH': readability['avg_sentence_length'],
-                'PERCENTAGE OF COMPLEX WORDS': readability['percentage_complex_words'],
-                'FOG INDEX': readability['fog_index'],
-                'AVG NUMBER OF WORDS PER SENTENCE': readability['avg_words_per_sentence'],
-                'COMPLEX WORD COUNT': readability['complex_word_count'],
-                'WORD COUNT': readability['word_count'],
-                'SYLLABLE PER WORD': readability['syllables_per_word'],
-                'PERSONAL PRONOUNS': pronouns,
-                'AVG WORD LENGTH': readability['avg_word_length']
-            }
+        profile = self.profiler.active() if self.profiler else None
+        if fetched:
+            title, content, failure, extract_time = fetched
+            if profile and extract_time:
+                profile.stages['extract_article_text'] = extract_time
+        elif profile:
+            title, content, failure = profile.measure('extract_article_text', self.extract_article, url)
         else:
-            return {
-                'URL_ID': url_id, 'URL': url,
-                'POSITIVE SCORE': 0, 'NEGATIVE SCORE': 0, 'POLARITY SCORE': 0,
-                'SUBJECTIVITY SCORE': 0, 'AVG SENTENCE LENGTH': 0,
-                'PERCENTAGE OF COMPLEX WORDS': 0, 'FOG INDEX': 0,
-                'AVG NUMBER OF WORDS PER SENTENCE': 0, 'COMPLEX WORD COUNT': 0,
-                'WORD COUNT': 0, 'SYLLABLE PER WORD': 0, 'PERSONAL PRONOUNS': 0,
-                'AVG WORD LENGTH': 0
-            }
+            title, content, failure = self.extract_article(url)
+        if not content:
+            self.count('articles_without_content')
+            return self.empty_result(url_id, url, failure)
+
+        with self.timer('write'):
+            self.save_article_text(url_id, title, content)
+        content, result, duplicate_key = self.strip_and_reuse(url_id, url, content)
+        if result:
+            return result
+
+        with self.timer('score'):
+            if self.analysis_pool and profile is None:
+                metrics = self.analysis_pool.submit(_analyze_text_batch, [content]).result()[0]
+            else:
+                metrics = self.analyze_text(content)
+        return self.build_result(url_id, url, metrics, duplicate_key)
+
+    def timer(self, stage):
+        """Context manager timing a pipeline stage (a shared no-op unless instrumented)"""
+        return self.run_metrics.timer(stage) if self.run_metrics else NULL_TIMER
+
+    def count(self, name, n=1):
+        """Increment a run counter when instrumented"""
+        if self.run_metrics:
+            self.run_metrics.count(name, n)
+
+    def record_response(self, host, status, size, seconds, first_byte_seconds=None):
+        """Record an HTTP response (and its time to first byte) when instrumented"""
+        if not self.run_metrics:
+            return
+        self.run_metrics.record_response(host, status, size, seconds)
+        if first_byte_seconds is not None:
+            # requests reports when the headers arrived: connect + server time
+            self.run_metrics.observe('fetch_first_byte', first_byte_seconds)
+            self.run_metrics.observe('fetch_body', max(0.0, seconds - first_byte_seconds))
+
+    def save_metrics_report(self):
+        """Write the run report to metrics_report, if one was requested"""
+        if self.run_metrics and self.metrics_report:
+            self.run_metrics.save(self.metrics_report)
+            print(f"Run metrics saved to {self.metrics_report}")
+
+    def save_article_text(self, url_id, title, content):
+        """Save extracted text to extracted_articles/{url_id}.txt"""
+        os.makedirs('extracted_articles', exist_ok=True)
+        with open(f'extracted_articles/{url_id}.txt', 'w', encoding='utf-8') as f:
+            f.write(f"Title: {title}\n\nContent:\n{content}")
 
-    def process_all_articles(self, input_file= r"C:/Users/HP/Downloads/NLP Project/Input.xlsx", output_file= "Output.xlsx"):
-        """Process all articles and generate final results"""
+    def read_saved_article(self, url_id):
+        """Content saved by save_article_text for url_id, or None when there is no file"""
+        try:
+            with open(f'extracted_articles/{url_id}.txt', 'r', encoding='utf-8') as f:
+                return self.parse_saved_article(f.read())[1]
+        except OSError:
+            return None
+
+    def strip_and_reuse(self, url_id, url, content):
+        """remove_boilerplate then reuse_duplicate: (stripped content, duplicate row or None, key)"""
+        content = self.remove_boilerplate(url, content)
+        return (content,) + self.reuse_duplicate(url_id, url, content)
+
+    def reuse_duplicate(self, url_id, url, content):
+        """Return (result row, None) for a duplicate article, else (None, key for build_result)"""
+        if not self.duplicates:
+            return None, None
+        with self.timer('duplicate_lookup'):
+            original, digest, signature = self.duplicates.match(content, url_id)
+        if not original:
+            return None, (digest, signature)
+        self.count('duplicates')
+
+        result = {'URL_ID': url_id, 'URL': url}
+        result.update(original['metrics'])
+        # An unchanged article from an earlier run is not a duplicate of itself
+        result[DUPLICATE_COLUMN] = original['id'] if original['id'] != str(url_id) else ''
+        return result, None
+
+    def build_result(self, url_id, url, metrics, duplicate_key=None):
+        """Result row for a freshly scored article, indexing it for duplicate detection"""
+        result = {'URL_ID': url_id, 'URL': url}
+        result.update(metrics)
+        if self.duplicates:
+            self.duplicates.add(url_id, url, *duplicate_key, metrics)
+            result[DUPLICATE_COLUMN] = ''
+        return result
+
+    def start_analysis_pool(self, processes=None):
+        """Start scoring worker processes, each holding one copy of the loaded dictionaries"""
+        self.stop_analysis_pool()
+        # The dictionaries travel once per worker through the initializer
+        # rather than being pickled with every task
+        self.analysis_workers = processes or os.cpu_count() or 1
+        self.analysis_pool = ProcessPoolExecutor(
+            max_workers=self.analysis_workers,
+            initializer=_init_analysis_worker,
+            initargs=(self.positive_words, self.negative_words, self.stopwords, self.segmenter)
+        )
+
+    def stop_analysis_pool(self):
+        """Shut down the scoring worker processes, if running"""
+        if self.analysis_pool:
+            self.analysis_pool.shutdown()
+            self.analysis_pool = None
+
+    def analyze_texts(self, texts, batch_size=64):
+        """Yield metric dicts for many texts in input order
+
+        With an analysis pool running, texts are scored in batches across
+        the worker processes; only a few batches per worker are in flight at
+        a time, so texts can be a lazy iterator over a large corpus.
+        """
+        texts = iter(texts)
+        if self.analysis_pool is None:
+            for text in texts:
+                yield self.analyze_text(text)
+            return
+
+        window = 2 * self.analysis_workers
+        in_flight = deque()
+        while True:
+            while len(in_flight) < window:
+                batch = list(islice(texts, batch_size))
+                if not batch:
+                    break
+                in_flight.append(self.analysis_pool.submit(_analyze_text_batch, batch))
+            if not in_flight:
+                return
+            yield from in_flight.popleft().result()
+
+    def learn_boilerplate(self, url, content):
+        """Fingerprint a page for its host's template, when boilerplate stripping is on"""
+        if self.boilerplate is None or not url or not content:
+            return
+        with self.timer('boilerplate'):
+            self.boilerplate.learn(urlparse(url).netloc.lower(), content)
+
+    def remove_boilerplate(self, url, content):
+        """Strip template text learned from the URL's host, when boilerplate stripping is on"""
+        if self.boilerplate is None or not url:
+            return content
+        with self.timer('boilerplate'):
+            return self.boilerplate.strip(urlparse(url).netloc.lower(), content)
+
+    def prefetch_for_boilerplate(self, rows):
+        """Extract the articles for (URL_ID, URL) rows and learn templates from all of them
+
+        Returns the (title, content, failure reason, extraction time) of each
+        row, in order, for analyze_article, so every page is stripped with
+        the same, complete templates.
+        """
+        def extract(row):
+            if not self.profiler:
+                return self.extract_article(row[1]) + (None,)
+            profile = ArticleProfile(row[0])
+            article = profile.measure('extract_article_text', self.extract_article, row[1])
+            return article + (profile.stages['extract_article_text'],)
+
+        fetched = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for (_, url), article in zip(rows, executor.map(extract, rows)):
+                self.learn_boilerplate(url, article[1])
+                fetched.append(article)
+        return fetched
+
+    def learn_resumed_boilerplate(self, rows):
+        """Learn templates from articles resumed from the journal
+
+        A resumed run must learn from the same pages as an uninterrupted
+        one, so each resumed article's saved text is read back; articles
+        whose file is gone are extracted again.
+        """
+        missing = []
+        for url_id, url in rows:
+            content = self.read_saved_article(url_id)
+            if content is None:
+                missing.append((url_id, url))
+            else:
+                self.learn_boilerplate(url, content)
+        if missing:
+            self.prefetch_for_boilerplate(missing)
+
+    def empty_result(self, url_id, url, failure=''):
+        """Zero-filled result row for articles that could not be analyzed"""
+        result = {
+            'URL_ID': url_id, 'URL': url,
+            'POSITIVE SCORE': 0, 'NEGATIVE SCORE': 0, 'POLARITY SCORE': 0,
+            'SUBJECTIVITY SCORE': 0, 'AVG SENTENCE LENGTH': 0,
+            'PERCENTAGE OF COMPLEX WORDS': 0, 'FOG INDEX': 0,
+            'AVG NUMBER OF WORDS PER SENTENCE': 0, 'COMPLEX WORD COUNT': 0,
+            'WORD COUNT': 0, 'SYLLABLE PER WORD': 0, 'PERSONAL PRONOUNS': 0,
+            'AVG WORD LENGTH': 0
+        }
+        if self.duplicates:
+            result[DUPLICATE_COLUMN] = ''
+        if self.record_failures:
+            result[FAILURE_COLUMN] = failure
+        return result
+
+    def result_columns(self):
+        """Output columns for this analyzer's result rows"""
+        columns = RESULT_COLUMNS + [DUPLICATE_COLUMN] if self.duplicates else RESULT_COLUMNS
+        return columns + [FAILURE_COLUMN] if self.record_failures else columns
+
+    def scoring_key(self):
+        """Hash of the word lists and scoring settings; saved metrics are only valid for the same key"""
+        digest = hashlib.sha256()
+        for words in (self.positive_words, self.negative_words, self.stopwords):
+            digest.update('\n'.join(sorted(words)).encode('utf-8') + b'\0')
+        settings = {
+            'sentence_mode': self.segmenter.mode,
+            'abbreviations': sorted(self.segmenter.abbreviations) if self.segmenter.mode != 'compat' else None,
+            'boilerplate': self.boilerplate.params() if self.boilerplate else None,
+            'profiles': self.profiles.params(),
+        }
+        digest.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def safe_analyze_article(self, url_id, url, fetched=None):
+        """analyze_article that turns any failure into an empty result row"""
+        self.count('articles')
+        profile = self.profiler.start(url_id) if self.profiler else None
+        try:
+            with self.timer('article'):
+                result = self.analyze_article(url_id, url, fetched)
+        except Exception as e:
+            return self.failed_result(url_id, url, e)
+        finally:
+            if profile:
+                self.profiler.finish(profile)
+        return self.finish_result(result)
+
+    def failed_result(self, url_id, url, error):
+        """Empty result row for an article whose analysis raised"""
+        print(f"Error processing {url_id}: {error}")
+        self.count('errors')
+        return self.empty_result(url_id, url, failure_reason(error))
+
+    def finish_result(self, result):
+        """Complete a successful result row with the optional columns"""
+        if self.record_failures:
+            result.setdefault(FAILURE_COLUMN, '')
+        return result
+
+    def process_all_articles(self, input_file= r"C:/Users/HP/Downloads/NLP Project/Input.xlsx", output_file= "Output.xlsx",
+                             journal_file=None, output_backend=None):
+        """Process all articles and generate final results
+
+        If journal_file is given, every result is checkpointed to it as it
+        completes, and articles already recorded there with the same URL,
+        word lists and scoring settings are reused instead of being fetched
+        again (earlier failures are retried).
+
+        output_backend is 'excel', 'csv', 'parquet' or any object with a
+        save(results_df, path) method; by default it follows the output file
+        extension, so Output.xlsx is still written as Excel.
+        """
 
         print("Loading input data...")
-        input_df = pd.read_excel(input_file)
+        rows = list(self.iter_input_rows(input_file))
 
         print("Loading word lists...")
         self.load_word_lists()
+        scoring_key = self.scoring_key()
+        if self.duplicates:
+            self.duplicates.load(scoring_key)
+        if self.analysis_processes:
+            self.start_analysis_pool(self.analysis_processes)
+        self.start_deadline()
 
-        print(f"Processing {len(input_df)} articles...")
-        all_results = []
-
-        for i, row in input_df.iterrows():
-            url_id = row['URL_ID']
-            url = row['URL']
+        print(f"Processing {len(rows)} articles with {self.workers} worker(s)...")
+        all_results = ResultTable(len(rows), self.result_columns())
 
-            try:
-                result = self.analyze_article(url_id, url)
-                all_results.append(result)
-                time.sleep(0.5)  # Be respectful to servers
-
-                if (i + 1) % 10 == 0:
-                    print(f"Completed {i + 1}/{len(input_df)} articles")
+        # Resume from the journal: rows that failed last time are retried
+        journal = CheckpointJournal(journal_file, scoring_key) if journal_file else None
+        recorded = journal.load() if journal else {}
+        pending = []
+        for i, (url_id, url) in enumerate(rows):
+            record = recorded.get(str(url_id))
+            if CheckpointJournal.is_complete(record, url):
+                record['URL_ID'] = url_id
+                if self.duplicates:
+                    record.setdefault(DUPLICATE_COLUMN, '')
+                if self.record_failures:
+                    record.setdefault(FAILURE_COLUMN, '')
+                all_results[i] = record
+            else:
+                pending.append(i)
+        if journal:
+            print(f"Resuming: {len(rows) - len(pending)} articles already in {journal_file}")
 
-            except Exception as e:
-                print(f"Error processing {url_id}: {e}")
-                all_results.append({
-                    'URL_ID': url_id, 'URL': url,
-                    'POSITIVE SCORE': 0, 'NEGATIVE SCORE': 0, 'POLARITY SCORE': 0,
-                    'SUBJECTIVITY SCORE': 0, 'AVG SENTENCE LENGTH': 0,
-                    'PERCENTAGE OF COMPLEX WORDS': 0, 'FOG INDEX': 0,
-                    'AVG NUMBER OF WORDS PER SENTENCE': 0, 'COMPLEX WORD COUNT': 0,
-                    'WORD COUNT': 0, 'SYLLABLE PER WORD': 0, 'PERSONAL PRONOUNS': 0,
-                    'AVG WORD LENGTH': 0
-                })
-
-        # Save results
-        import os
-        my_directory = "C:/Users/HP/Downloads/NLP Project/Results"
-        os.makedirs(my_directory, exist_ok=True)
-        # just the file name
-        
+        # Boilerplate templates are learned from every page before any page
+        # is scored, so an article's metrics don't depend on its position
+        fetched = {}
+        if self.boilerplate:
+            self.boilerplate.load()
+            print("Extracting articles to learn site templates...")
+            fetched = dict(zip(pending, self.prefetch_for_boilerplate([rows[i] for i in pending])))
+            pending_set = set(pending)
+            self.learn_resumed_boilerplate([row for i, row in enumerate(rows) if i not in pending_set])
 
-        results_df = pd.DataFrame(all_results)
-        results_df.to_excel(f"{my_directory}/{output_file}", index=False)
+        # Politeness is enforced per host by self.rate_limiter inside
+        # extract_article_text, so workers only wait on their own host
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(self.safe_analyze_article, *rows[i], fetched.pop(i, None)): i
+                    for i in pending
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    result = future.result()
+                    all_results[futures[future]] = result
+                    if journal:
+                        journal.append(result)
 
+                    if done % 10 == 0:
+                        print(f"Completed {done}/{len(pending)} articles")
+        finally:
+            if self.analysis_processes:
+                self.stop_analysis_pool()
+            if self.duplicates:
+                self.duplicates.save()
+            if self.boilerplate:
+                self.boilerplate.save()
+            self.save_metrics_report()
+            if self.profiler:
+                self.profiler.report(self)
 
+        results_df = self.save_results(all_results, output_file, output_backend)
 
         print(f"\n=== ANALYSIS COMPLETE ===")
         print(f"Results saved to:{output_file}")
         print(f"Articles processed: {len(results_df)}")
-        print(f"Articles with content: {sum(1 for _, row in results_df.iterrows() if row['WORD COUNT'] > 0)}")
+        print(f"Articles with content: {int((results_df['WORD COUNT'] > 0).sum())}")
+        if self.duplicates:
+            print(f"Duplicates reusing metrics: {int((results_df[DUPLICATE_COLUMN] != '').sum())}")
+
+        return results_df
+
+
+    def stream_all_articles(self, input_file=r"C:/Users/HP/Downloads/NLP Project/Input.xlsx",
+                            output_file="Output.csv", journal_file=None):
+        """Process articles in constant memory, writing each result as soon as it is ready
+
+        Input rows are read lazily (xlsx, csv, jsonl or parquet) and only a
+        bounded window of articles is in flight at once. Results are written
+        in input order by a streaming writer chosen from the output file
+        extension (.csv, .jsonl, .xlsx or .parquet). Returns the number of
+        rows written.
+        """
+        print("Loading word lists...")
+        self.load_word_lists()
+        scoring_key = self.scoring_key()
+        if self.duplicates:
+            self.duplicates.load(scoring_key)
+        # Streamed pages are stripped with templates saved by an earlier batch
+        # run; learning them here would make results depend on input order
+        if self.boilerplate:
+            self.boilerplate.load()
+        if self.analysis_processes:
+            self.start_analysis_pool(self.analysis_processes)
+        self.start_deadline()
+
+        journal = CheckpointJournal(journal_file, scoring_key) if journal_file else None
+        recorded = journal.load() if journal else {}
+
+        output_path = self.results_path(output_file)
+        window = 4 * self.workers
+        in_flight = deque()
+        done = 0
+
+        def emit(result, from_journal):
+            nonlocal done
+            writer.write(result)
+            if journal and not from_journal:
+                journal.append(result)
+            done += 1
+            if done % 1000 == 0:
+                print(f"Completed {done} articles")
+
+        print(f"Streaming articles from {input_file} with {self.workers} worker(s)...")
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor, \
+                    open_result_writer(output_path, self.result_columns()) as writer:
+                for url_id, url in self.iter_input_rows(input_file):
+                    record = recorded.pop(str(url_id), None)
+                    if CheckpointJournal.is_complete(record, url):
+                        record['URL_ID'] = url_id
+                        in_flight.append((record, True))
+                    else:
+                        in_flight.append((executor.submit(self.safe_analyze_article, url_id, url), False))
+
+                    # Drain finished results in input order once the window is full
+                    while len(in_flight) > window or (in_flight and in_flight[0][1]):
+                        item, from_journal = in_flight.popleft()
+                        emit(item if from_journal else item.result(), from_journal)
+
+                while in_flight:
+                    item, from_journal = in_flight.popleft()
+                    emit(item if from_journal else item.result(), from_journal)
+        finally:
+            if self.analysis_processes:
+                self.stop_analysis_pool()
+            if self.duplicates:
+                self.duplicates.save()
+            self.save_metrics_report()
+            if self.profiler:
+                self.profiler.report(self)
+
+        print(f"\n=== ANALYSIS COMPLETE ===")
+        print(f"Results saved to:{output_path}")
+        print(f"Articles processed: {done}")
+        return done
+
+    def iter_input_rows(self, input_file):
+        """Yield (URL_ID, URL) pairs lazily from an xlsx, csv, jsonl or parquet input file"""
+        extension = os.path.splitext(input_file)[1].lower()
+
+        if extension == '.csv':
+            with open(input_file, 'r', encoding='utf-8', newline='') as f:
+                for row in csv.DictReader(f):
+                    yield row['URL_ID'], row['URL']
+
+        elif extension == '.jsonl':
+            with open(input_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        row = json.loads(line)
+                        yield row['URL_ID'], row['URL']
+
+        elif extension == '.parquet':
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(input_file).iter_batches(columns=['URL_ID', 'URL']):
+                yield from zip(batch.column(0).to_pylist(), batch.column(1).to_pylist())
+
+        else:
+            # Read-only mode streams rows from the sheet without loading it whole
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(input_file, read_only=True)
+            try:
+                rows = workbook.active.iter_rows(values_only=True)
+                header = list(next(rows))
+                id_col, url_col = header.index('URL_ID'), header.index('URL')
+                for row in rows:
+                    if row[id_col] is not None or row[url_col] is not None:
+                        yield row[id_col], row[url_col]
+            finally:
+                workbook.close()
+
+    def results_path(self, output_file):
+        """Resolve an output file name inside the Results folder"""
+        my_directory = os.path.join(DATA_DIR, "Results")
+        os.makedirs(my_directory, exist_ok=True)
+        return os.path.join(my_directory, output_file)
 
+    def save_results(self, all_results, output_file="Output.xlsx", output_backend=None):
+        """Write result rows (a ResultTable or list of dicts) to the Results folder and return them as a DataFrame"""
+        if isinstance(all_results, ResultTable):
+            results_df = all_results.to_dataframe()
+        else:
+            results_df = pd.DataFrame(all_results)
+        get_output_backend(output_backend, output_file).save(results_df, self.results_path(output_file))
+        return results_df
+
+    def iter_saved_articles(self, source='extracted_articles'):
+        """Yield (url_id, raw text) for saved article files in a directory, zip or tar archive"""
+        if os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                if name.endswith('.txt'):
+                    with open(os.path.join(source, name), 'r', encoding='utf-8') as f:
+                        yield name[:-4], f.read()
+
+        elif zipfile.is_zipfile(source):
+            with zipfile.ZipFile(source) as archive:
+                for name in sorted(archive.namelist()):
+                    if name.endswith('.txt'):
+                        yield os.path.basename(name)[:-4], archive.read(name).decode('utf-8')
+
+        else:
+            # Stream mode reads members in archive order without an index
+            with tarfile.open(source, 'r|*') as archive:
+                for member in archive:
+                    if member.isfile() and member.name.endswith('.txt'):
+                        raw = archive.extractfile(member).read().decode('utf-8')
+                        yield os.path.basename(member.name)[:-4], raw
+
+    def parse_saved_article(self, raw):
+        """Split a saved article file back into (title, content)"""
+        if raw.startswith('Title: '):
+            header, sep, content = raw.partition('\n\nContent:\n')
+            if sep:
+                return header[len('Title: '):], content
+        return '', raw
+
+    def reanalyze_saved_articles(self, source='extracted_articles', output_file="Output.xlsx",
+                                 input_file=None, batch_size=64, output_backend=None):
+        """Re-score saved article texts without fetching anything
+
+        source is the extracted_articles directory (or a zip/tar archive of
+        it). Files are streamed and scored through analyze_texts, so an
+        analysis pool started with analysis_processes spreads the work over
+        all cores. Without input_file rows come out in file name order. With
+        input_file (xlsx, csv, jsonl or parquet) they line up with the input
+        like process_all_articles output: one row per input row, in input
+        order, zero-filled for articles with no saved text. Saved files not
+        in the input are left out.
+        """
+        print("Loading word lists...")
+        self.load_word_lists()
+
+        rows = list(self.iter_input_rows(input_file)) if input_file else None
+        urls = {str(url_id): url for url_id, url in rows} if rows else {}
+        # Scored rows by URL_ID, emitted in input order once all are scored
+        scored = {}
+
+        # Learn templates from every saved page before stripping any
+        if self.boilerplate:
+            self.boilerplate.load()
+            for url_id, raw in self.iter_saved_articles(source):
+                self.learn_boilerplate(urls.get(url_id), self.parse_saved_article(raw)[1])
+
+        # (url_id, has content) for each text handed to the scorer, in order
+        articles = []
+
+        def contents():
+            for url_id, raw in self.iter_saved_articles(source):
+                content = self.parse_saved_article(raw)[1]
+                articles.append((url_id, bool(content)))
+                if content:
+                    content = self.remove_boilerplate(urls.get(url_id), content)
+                yield content
+
+        if self.analysis_processes:
+            self.start_analysis_pool(self.analysis_processes)
+        all_results = ResultTable()
+        try:
+            for i, metrics in enumerate(self.analyze_texts(contents(), batch_size)):
+                url_id, has_content = articles[i]
+                if has_content:
+                    row = {'URL_ID': url_id, 'URL': urls.get(url_id, '')}
+                    row.update(metrics)
+                else:
+                    row = self.empty_result(url_id, urls.get(url_id, ''))
+                if rows is None:
+                    all_results.append(row)
+                elif url_id in urls:
+                    scored[url_id] = row
+
+                if (i + 1) % 1000 == 0:
+                    print(f"Re-scored {i + 1} articles")
+
+            for url_id, url in rows or ():
+                row = scored.get(str(url_id))
+                row = dict(row, URL_ID=url_id) if row else self.empty_result(url_id, url)
+                all_results.append(row)
+        finally:
+            if self.analysis_processes:
+                self.stop_analysis_pool()
+            if self.boilerplate:
+                self.boilerplate.save()
+
+        results_df = self.save_results(all_results, output_file, output_backend)
+        print(f"\n=== RE-ANALYSIS COMPLETE ===")
+        print(f"Results saved to:{output_file}")
+        print(f"Articles re-scored: {len(results_df)}")
         return results_df
 
+
+class AsyncNLPAnalyzer:
+    """
+    asyncio front end for ComprehensiveNLPAnalyzer
+
+    Fetches run on the event loop with per-host pacing from an
+    AsyncHostRateLimiter, using aiohttp when it is installed and the
+    analyzer's requests session in worker threads otherwise. Parsing and
+    file writes run in threads, and scoring goes to the analyzer's process
+    pool when analysis_processes is set. Extraction, boilerplate, duplicate
+    and cache settings all come from the wrapped analyzer.
+
+        async with AsyncNLPAnalyzer(ComprehensiveNLPAnalyzer(cache_dir='http_cache')) as nlp:
+            async for result in nlp.analyze_articles(rows):
+                ...
+    """
+
+    def __init__(self, analyzer=None, concurrency=100):
+        self.analyzer = analyzer or ComprehensiveNLPAnalyzer()
+        self.concurrency = concurrency
+        limiter = self.analyzer.rate_limiter
+        self.rate_limiter = AsyncHostRateLimiter(limiter.delay, limiter.max_per_host, limiter.host_delays)
+        self.http = None
+        # Errors that count against the circuit breaker and are retried
+        self.retryable_errors = RETRYABLE_ERRORS + (asyncio.TimeoutError,)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def start(self):
+        """Load word lists (if not loaded yet), the duplicate index, scoring pool and HTTP client"""
+        analyzer = self.analyzer
+        if not analyzer.stopwords:
+            await asyncio.to_thread(analyzer.load_word_lists)
+        if analyzer.duplicates:
+            await asyncio.to_thread(analyzer.duplicates.load, analyzer.scoring_key())
+        if analyzer.boilerplate:
+            await asyncio.to_thread(analyzer.boilerplate.load)
+        if analyzer.analysis_processes and analyzer.analysis_pool is None:
+            analyzer.start_analysis_pool(analyzer.analysis_processes)
+        analyzer.start_deadline()
+
+        try:
+            import aiohttp
+        except ImportError:
+            print("aiohttp not installed; fetching with requests in worker threads")
+            return
+        self.http = aiohttp.ClientSession(
+            headers={'User-Agent': analyzer.session.headers['User-Agent']},
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+        )
+        self.retryable_errors += (aiohttp.ClientConnectionError,)
+
+    async def close(self):
+        """Close the HTTP client, stop the scoring pool and save the duplicate index"""
+        if self.http:
+            await self.http.close()
+            self.http = None
+        if self.analyzer.analysis_processes:
+            self.analyzer.stop_analysis_pool()
+        if self.analyzer.duplicates:
+            await asyncio.to_thread(self.analyzer.duplicates.save)
+        self.analyzer.save_metrics_report()
+
+    async def get(self, url, headers, timeout):
+        """GET a URL and return (status, body, response headers)"""
+        if self.http is None:
+            return await asyncio.to_thread(self.get_blocking, url, headers, timeout)
+
+        import aiohttp
+
+        if isinstance(timeout, tuple):
+            timeout = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        else:
+            timeout = aiohttp.ClientTimeout(total=timeout)
+        async with self.http.get(url, headers=headers, timeout=timeout) as response:
+            if not 200 <= response.status < 300:
+                return response.status, b'', response.headers
+            body = BoundedBody(self.analyzer.fetch_policy, response.headers)
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                body.add(chunk)
+            return response.status, body.data(), response.headers
+
+    def get_blocking(self, url, headers, timeout):
+        """get() through the analyzer's requests session, run in a worker thread"""
+        with self.analyzer.session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            body = self.analyzer.read_body(response) if 200 <= response.status_code < 300 else b''
+            return response.status_code, body, response.headers
+
+    async def wait_before_retry(self, delay):
+        """Back off before a retry, unless that would run past the deadline"""
+        deadline = self.analyzer.deadline
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            raise DeadlineExceeded("run deadline exceeded")
+        await asyncio.sleep(delay)
+
+    async def fetch_html(self, url):
+        """Download raw HTML for a URL, revalidating against the cache if enabled"""
+        analyzer = self.analyzer
+        cached = await asyncio.to_thread(analyzer.cache.get, url) if analyzer.cache else None
+        if analyzer.offline:
+            return analyzer.offline_body(cached)
+        headers = analyzer.revalidation_headers(cached)
+
+        host = urlparse(url).netloc.lower()
+        attempt = 0
+        while True:
+            timeout, probe = analyzer.begin_fetch_attempt(host)
+            status = body = response_headers = error = None
+            start = time.perf_counter()
+            try:
+                with analyzer.timer('rate_limit_wait'):
+                    await self.rate_limiter.acquire(url)
+                start = time.perf_counter()
+                try:
+                    status, body, response_headers = await self.get(url, headers, timeout)
+                finally:
+                    self.rate_limiter.release(host)
+            except BaseException as e:
+                error = e
+            delay = analyzer.end_fetch_attempt(host, attempt, probe, time.perf_counter() - start,
+                                               status, body, response_headers, error,
+                                               retryable=self.retryable_errors)
+            if delay is None:
+                break
+            analyzer.count('retries')
+            await self.wait_before_retry(delay)
+            attempt += 1
+
+        return await asyncio.to_thread(analyzer.finish_fetch, url, cached, status, body, response_headers)
+
+    async def extract_article_text(self, url):
+        """Fetch and parse an article, returning ("", "") on failure"""
+        title, content, _ = await self.extract_article(url)
+        return title, content
+
+    async def extract_article(self, url):
+        """extract_article_text that also returns why nothing was extracted ('' on success)"""
+        try:
+            html = await self.fetch_html(url)
+            return await asyncio.to_thread(self.analyzer.parse_fetched, html, url)
+        except Exception as e:
+            return self.analyzer.extraction_failed(url, e)
+
+    async def score(self, content):
+        """Compute the metric columns off the event loop"""
+        analyzer = self.analyzer
+        if analyzer.analysis_pool:
+            loop = asyncio.get_running_loop()
+            return (await loop.run_in_executor(analyzer.analysis_pool, _analyze_text_batch, [content]))[0]
+        return await asyncio.to_thread(analyzer.analyze_text, content)
+
+    async def analyze_article(self, url_id, url):
+        """Complete analysis of single article"""
+        analyzer = self.analyzer
+        print(f"Analyzing {url_id}...")
+
+        title, content, failure = await self.extract_article(url)
+        if not content:
+            analyzer.count('articles_without_content')
+            return analyzer.empty_result(url_id, url, failure)
+
+        with analyzer.timer('write'):
+            await asyncio.to_thread(analyzer.save_article_text, url_id, title, content)
+        # Boilerplate fingerprinting and the duplicate index are CPU work
+        # that would stall every other fetch on the event loop
+        content, result, duplicate_key = await asyncio.to_thread(
+            analyzer.strip_and_reuse, url_id, url, content)
+        if result:
+            return result
+        with analyzer.timer('score'):
+            metrics = await self.score(content)
+        return await asyncio.to_thread(analyzer.build_result, url_id, url, metrics, duplicate_key)
+
+    async def safe_analyze_article(self, url_id, url):
+        """analyze_article that turns any failure into an empty result row"""
+        self.analyzer.count('articles')
+        try:
+            with self.analyzer.timer('article'):
+                result = await self.analyze_article(url_id, url)
+        except Exception as e:
+            return self.analyzer.failed_result(url_id, url, e)
+        return self.analyzer.finish_result(result)
+
+    async def analyze_articles(self, rows):
+        """Yield result rows as they complete for (URL_ID, URL) pairs
+
+        rows may be a plain or async iterable; at most `concurrency`
+        articles are in flight, so it can be an unbounded stream.
+        """
+        if not hasattr(rows, '__aiter__'):
+            rows = _aiter(rows)
+
+        pending = set()
+        try:
+            async for url_id, url in rows:
+                pending.add(asyncio.ensure_future(self.safe_analyze_article(url_id, url)))
+                if len(pending) >= self.concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # The consumer stopped early: don't leave fetches running
+            for task in pending:
+                task.cancel()
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON endpoints of the scoring service (see serve_scoring)
+
+    GET  /health   word list sizes
+    GET  /metrics  run metrics in Prometheus text format (analyzer built with instrument=True)
+    POST /score    {"text": ...} or {"texts": [...]}
+    POST /analyze  {"url": ..., "url_id": ...} or {"urls": [url or {"url_id", "url"}, ...]}
+
+    Batches return {"results": [...]} in input order. With ?stream=1 a batch
+    is sent as chunked JSON lines, each written as soon as it is scored.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; don't let Nagle hold them
+    disable_nagle_algorithm = True
+
+    @property
+    def analyzer(self):
+        return self.server.analyzer
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == '/metrics' and self.analyzer.run_metrics:
+            body = self.analyzer.run_metrics.prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if path != '/health':
+            return self.send_json(404, {'error': f"Unknown endpoint: {self.path}"})
+        self.send_json(200, {
+            'status': 'ok', 'positive_words': len(self.analyzer.positive_words),
+            'negative_words': len(self.analyzer.negative_words), 'stopwords': len(self.analyzer.stopwords)
+        })
+
+    def do_POST(self):
+        path = urlparse(self.path)
+        stream = 'stream=1' in path.query.split('&')
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(request, dict):
+                raise ValueError("request body must be a JSON object")
+
+            if path.path == '/score':
+                if 'text' in request:
+                    return self.send_json(200, self.analyzer.analyze_text(str(request['text'])))
+                results = self.analyzer.analyze_texts([str(text) for text in self.batch(request, 'texts')])
+            elif path.path == '/analyze':
+                if 'url' in request:
+                    url_id, url = self.url_row(request)
+                    return self.send_json(200, self.analyzer.safe_analyze_article(url_id, url))
+                # Validate the whole batch before the response starts
+                rows = [self.url_row(item if isinstance(item, dict) else {'url': item})
+                        for item in self.batch(request, 'urls')]
+                results = self.analyze_urls(rows)
+            else:
+                return self.send_json(404, {'error': f"Unknown endpoint: {path.path}"})
+        except (KeyError, TypeError, ValueError) as e:
+            return self.send_json(400, {'error': f"Bad request: {e!r}"})
+
+        if stream:
+            self.send_stream(results)
+        else:
+            self.send_json(200, {'results': list(results)})
+
+    @staticmethod
+    def batch(request, key):
+        """The request's list under key (KeyError/TypeError become a 400)"""
+        items = request[key]
+        if not isinstance(items, list):
+            raise TypeError(f"{key} must be a list")
+        return items
+
+    def url_row(self, item):
+        """(URL_ID, URL) for a {"url", "url_id"} object, defaulting the URL_ID"""
+        url = item['url']
+        if not isinstance(url, str):
+            raise TypeError("url must be a string")
+        return item.get('url_id') or self.default_url_id(url), url
+
+    def analyze_urls(self, rows):
+        """Yield result rows for (URL_ID, URL) pairs in order, fetched by the analyzer's workers"""
+        with ThreadPoolExecutor(max_workers=self.analyzer.workers) as executor:
+            yield from executor.map(lambda row: self.analyzer.safe_analyze_article(*row), rows)
+
+    @staticmethod
+    def default_url_id(url):
+        """URL_ID for a URL sent without one (it names the saved article file)"""
+        return 'url-' + hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload, default=_json_default).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_stream(self, results):
+        """Send results as chunked JSON lines as they are produced"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for result in results:
+            line = json.dumps(result, default=_json_default).encode('utf-8') + b'\n'
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(line), line))
+        self.wfile.write(b'0\r\n\r\n')
+
+
+def serve_scoring(analyzer=None, host='127.0.0.1', port=8000):
+    """Run the scoring service until interrupted, with the word lists loaded once"""
+    analyzer = analyzer or ComprehensiveNLPAnalyzer()
+    analyzer.load_word_lists()
+    if analyzer.duplicates:
+        analyzer.duplicates.load(analyzer.scoring_key())
+    if analyzer.boilerplate:
+        analyzer.boilerplate.load()
+    if analyzer.analysis_processes:
+        analyzer.start_analysis_pool(analyzer.analysis_processes)
+
+    server = ThreadingHTTPServer((host, port), ScoringRequestHandler)
+    server.daemon_threads = True
+    server.analyzer = analyzer
+    print(f"Scoring service listening on http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if analyzer.analysis_processes:
+            analyzer.stop_analysis_pool()
+        if analyzer.duplicates:
+            analyzer.duplicates.save()
+
+
+async def _aiter(iterable):
+    """Wrap a plain iterable as an async iterator"""
+    for item in iterable:
+        yield item
+
+
+# Process-pool scoring: each worker builds its own analyzer once from the
+# dictionaries passed to the initializer
+_worker_analyzer = None
+
+
+def _init_analysis_worker(positive_words, negative_words, stopwords, segmenter=None):
+    """Process-pool initializer that installs the dictionaries in the worker"""
+    global _worker_analyzer
+    _worker_analyzer = ComprehensiveNLPAnalyzer()
+    _worker_analyzer.positive_words = positive_words
+    _worker_analyzer.negative_words = negative_words
+    _worker_analyzer.stopwords = stopwords
+    if segmenter:
+        _worker_analyzer.segmenter = segmenter
+
+
+def _analyze_text_batch(texts):
+    """Score a batch of texts inside a worker process"""
+    return [_worker_analyzer.analyze_text(text) for text in texts]
+
+
 # Main execution
 if __name__ == "__main__":
     analyzer = ComprehensiveNLPAnalyzer()
-    results = analyzer.process_all_articles()
+    if len(sys.argv) > 1 and sys.argv[1] == 'compile-lexicon':
+        # python complete_nlp_analyzer.py compile-lexicon [data dir]
+        data_dir = sys.argv[2] if len(sys.argv) > 2 else DATA_DIR
+        stamp = lexicon_source_stamp(data_dir)
+        analyzer.read_word_lists(data_dir)
+        write_lexicon(os.path.join(data_dir, LEXICON_FILE), stamp,
+                      analyzer.positive_words, analyzer.negative_words, analyzer.stopwords)
+        print(f"Compiled word lists to {os.path.join(data_dir, LEXICON_FILE)}")
+        sys.exit(0)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        # python complete_nlp_analyzer.py serve [port]
+        serve_scoring(analyzer, port=int(sys.argv[2]) if len(sys.argv) > 2 else 8000)
+        sys.exit(0)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'reanalyze':
+        # python complete_nlp_analyzer.py reanalyze [extracted_articles dir or archive]
+        analyzer.analysis_processes = os.cpu_count() or 1
+        results = analyzer.reanalyze_saved_articles(*sys.argv[2:3])
+    else:
+        results = analyzer.process_all_articles()
 
     # Display summary statistics
     print("\n=== SUMMARY STATISTICS ===")
-    numeric_cols = [col for col in results.columns if col not in ['URL_ID', 'URL']]
+    numeric_cols = [col for col in results.columns if col not in TEXT_COLUMNS]
     for col in numeric_cols:
         print(f"{col}: Mean={results[col].mean():.4f}, Range=({results[col].min():.4f}-{results[col].max():.4f})")
@@ -0,0 +1,57 @@
+"""AsyncHostRateLimiter slot handling and AsyncNLPAnalyzer event loop use"""
+import asyncio
+import os
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import AsyncHostRateLimiter, AsyncNLPAnalyzer, ComprehensiveNLPAnalyzer
+
+
+def test_cancel_during_pacing_releases_slot():
+    async def run():
+        limiter = AsyncHostRateLimiter(delay=60, max_per_host=1)
+        limiter.release(await limiter.acquire('http://h/a'))
+
+        # The second request waits out the 60 s delay holding the only slot
+        waiting = asyncio.ensure_future(limiter.acquire('http://h/b'))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        try:
+            await waiting
+        except asyncio.CancelledError:
+            pass
+        return limiter._slots['h'].locked()
+
+    assert asyncio.run(run()) is False
+
+
+def test_boilerplate_and_duplicate_index_run_off_the_event_loop(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    analyzer = ComprehensiveNLPAnalyzer(strip_boilerplate=True, detect_duplicates=True)
+    threads = {}
+
+    def recorded(name, func):
+        def call(*args):
+            threads[name] = threading.get_ident()
+            return func(*args)
+        return call
+
+    analyzer.remove_boilerplate = recorded('boilerplate', analyzer.remove_boilerplate)
+    analyzer.duplicates.add = recorded('index', analyzer.duplicates.add)
+
+    async def run():
+        nlp = AsyncNLPAnalyzer(analyzer)
+
+        async def extract_article(url):
+            return 'Title', 'We love good things. I hate bad ones.', ''
+        nlp.extract_article = extract_article
+        result = await nlp.analyze_article('a', 'http://example.com/a')
+        return result, threading.get_ident()
+
+    result, loop_thread = asyncio.run(run())
+    assert result['WORD COUNT'] == 8
+    assert set(threads) == {'boilerplate', 'index'}
+    assert loop_thread not in threads.values()
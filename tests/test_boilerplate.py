@@ -0,0 +1,141 @@
+"""BoilerplateFilter template learning and stripping"""
+import os
+import random
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import BoilerplateFilter, ComprehensiveNLPAnalyzer, FetchPolicy
+
+HEADER = "Home About Contact Our Services Blog Careers Login Subscribe to our newsletter"
+FOOTER = "Related posts you may also like Copyright 2024 All rights reserved Privacy Terms"
+
+
+def pages(n=6, seed=0):
+    rng = random.Random(seed)
+    return [f"{HEADER} " + ' '.join(f"body{rng.randrange(10000)}" for _ in range(80)) + f" {FOOTER}"
+            for _ in range(n)]
+
+
+def strip_all(texts, order):
+    boilerplate = BoilerplateFilter()
+    for i in order:
+        boilerplate.learn('example.com', texts[i])
+    return [boilerplate.strip('example.com', text) for text in texts]
+
+
+def test_template_removed_from_every_page():
+    texts = pages()
+    for text, stripped in zip(texts, strip_all(texts, range(len(texts)))):
+        assert 'Subscribe' not in stripped and 'Copyright' not in stripped
+        assert stripped.split() == text.split()[len(HEADER.split()):-len(FOOTER.split())]
+
+
+def test_result_does_not_depend_on_page_order():
+    texts = pages()
+    order = list(range(len(texts)))
+    random.Random(1).shuffle(order)
+    assert strip_all(texts, order) == strip_all(texts, range(len(texts)))
+
+
+def test_too_few_pages_are_left_alone():
+    texts = pages(2)
+    assert strip_all(texts, range(2)) == texts
+
+
+def test_templates_round_trip(tmp_path):
+    path = str(tmp_path / 'templates.json')
+    texts = pages()
+    learned = BoilerplateFilter(path)
+    for text in texts:
+        learned.learn('example.com', text)
+    learned.save()
+
+    loaded = BoilerplateFilter(path)
+    loaded.load()
+    assert [loaded.strip('example.com', text) for text in texts] == \
+        [learned.strip('example.com', text) for text in texts]
+
+    # Templates built with other settings are not reused
+    other = BoilerplateFilter(path, ratio=0.9)
+    other.load()
+    assert other.hosts == {}
+
+
+def test_reanalyze_learns_before_stripping(tmp_path):
+    source = tmp_path / 'articles'
+    source.mkdir()
+    texts = pages()
+    for i, text in enumerate(texts):
+        (source / f"a{i}.txt").write_text(f"Title: t\n\nContent:\n{text}", encoding='utf-8')
+    input_file = tmp_path / 'input.xlsx'
+    pd.DataFrame({'URL_ID': [f"a{i}" for i in range(len(texts))],
+                  'URL': [f"http://example.com/{i}" for i in range(len(texts))]}).to_excel(input_file, index=False)
+
+    analyzer = ComprehensiveNLPAnalyzer(strip_boilerplate=True)
+    analyzer.load_word_lists = lambda *args, **kwargs: None
+    results = analyzer.reanalyze_saved_articles(str(source), str(tmp_path / 'out.csv'), str(input_file))
+    assert set(results['WORD COUNT']) == {80}
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves pages()[n] at /n"""
+
+    def do_GET(self):
+        body = f"<html><body><article><p>{self.server.texts[int(self.path[1:])]}</p></article></body></html>"
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    httpd.texts = pages()
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_resumed_run_learns_from_journaled_pages(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('input.csv', 'w', encoding='utf-8') as f:
+        f.write('URL_ID,URL\n' + ''.join(f"a{i},{site}/{i}\n" for i in range(6)))
+
+    def run():
+        analyzer = ComprehensiveNLPAnalyzer(strip_boilerplate=True, host_delay=0,
+                                            fetch_policy=FetchPolicy(retries=0))
+        analyzer.load_word_lists = lambda *args, **kwargs: None
+        return analyzer.process_all_articles('input.csv', 'out.csv', journal_file='journal.jsonl')
+
+    full = run()
+    assert set(full['WORD COUNT']) == {80}
+
+    # Interrupted after four articles: only two are left to fetch and score
+    with open('journal.jsonl', encoding='utf-8') as f:
+        lines = f.readlines()
+    with open('journal.jsonl', 'w', encoding='utf-8') as f:
+        f.writelines(lines[:4])
+    assert run().equals(full)
+
+
+def test_prefetched_extraction_is_profiled(site, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    analyzer = ComprehensiveNLPAnalyzer(strip_boilerplate=True, profile=True, host_delay=0)
+    rows = [(f"a{i}", f"{site}/{i}") for i in range(3)]
+    fetched = analyzer.prefetch_for_boilerplate(rows)
+    analyzer.safe_analyze_article(*rows[0], fetched[0])
+    assert analyzer.profiler.records[0][1]['extract_article_text'][0] > 0
@@ -0,0 +1,55 @@
+"""Duplicate detection and reuse of saved metrics"""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import DUPLICATE_COLUMN, ComprehensiveNLPAnalyzer
+
+
+def article(words=400, seed=0):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(300)]
+    return ' '.join(rng.choice(vocabulary) + ('.' if rng.random() < 0.1 else '') for _ in range(words))
+
+
+def score(analyzer, url_id, text):
+    """analyze_article without the download: reuse a duplicate or score and index"""
+    result, key = analyzer.reuse_duplicate(url_id, f"http://example.com/{url_id}", text)
+    return result or analyzer.build_result(url_id, f"http://example.com/{url_id}",
+                                           analyzer.analyze_text(text), key)
+
+
+def test_near_duplicate_of_other_article_reuses_metrics():
+    analyzer = ComprehensiveNLPAnalyzer(detect_duplicates=True)
+    text = article()
+    first = score(analyzer, 'a', text)
+    copy = score(analyzer, 'b', text + ' word1 word2')
+    assert copy[DUPLICATE_COLUMN] == 'a'
+    assert copy['WORD COUNT'] == first['WORD COUNT']
+
+
+def test_edited_article_is_scored_again():
+    analyzer = ComprehensiveNLPAnalyzer(detect_duplicates=True)
+    text = article()
+    score(analyzer, 'a', text)
+    edited = text + ' ' + article(30, seed=1)
+    result = score(analyzer, 'a', edited)
+    assert result[DUPLICATE_COLUMN] == ''
+    assert result['WORD COUNT'] == analyzer.analyze_text(edited)['WORD COUNT']
+
+    # The edit replaced the old entry, so the new text now matches exactly
+    assert analyzer.duplicates.match(edited, 'a')[0]['metrics']['WORD COUNT'] == result['WORD COUNT']
+    assert len(analyzer.duplicates.entries) == 1
+
+
+def test_scoring_key_covers_scoring_settings():
+    keys = {
+        ComprehensiveNLPAnalyzer().scoring_key(),
+        ComprehensiveNLPAnalyzer(sentence_mode='abbreviations').scoring_key(),
+        ComprehensiveNLPAnalyzer(strip_boilerplate=True).scoring_key(),
+    }
+    assert len(keys) == 3
+    assert ComprehensiveNLPAnalyzer().scoring_key() == ComprehensiveNLPAnalyzer(workers=4).scoring_key()
@@ -0,0 +1,49 @@
+"""The fast extraction engine against the BeautifulSoup engine"""
+import glob
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer
+
+FIXTURES = sorted(glob.glob(os.path.join(ROOT, 'benchmarks', 'fixtures', '*.html')))
+soup = ComprehensiveNLPAnalyzer(extraction_engine='soup')
+fast = ComprehensiveNLPAnalyzer(extraction_engine='fast')
+
+
+@pytest.mark.parametrize('path', FIXTURES, ids=os.path.basename)
+def test_fixture_pages_match(path):
+    with open(path, 'rb') as f:
+        html = f.read()
+    assert fast.parse_article(html) == soup.parse_article(html)
+
+
+@pytest.mark.parametrize('reference', [
+    '&#8217;', '&#x2019;', '&#X2019;', '&#65zz', '&#x41g', '&#150;', '&#x81;', '&#0;',
+    '&#xD800;', '&#1114112;', '&#99999999999;', '&#xzz;', '&amp;', '&nbsp;', '&copy',
+])
+def test_character_references_match(reference):
+    html = f"<html><body><article><p>a {reference} b</p></article></body></html>"
+    assert fast.parse_article(html) == soup.parse_article(html)
+
+
+def profile_run(analyzer):
+    url = 'http://example.com/post'
+    for _ in range(3):
+        analyzer.parse_article('<html><body><div class="post-content">TEXT</div></body></html>', url)
+    html = '<html><body><article>ARTICLE TEXT</article><div class="post-content">sidebar</div></body></html>'
+    return analyzer.parse_article(html, url)[1]
+
+
+def test_profiles_are_not_learned_by_default():
+    assert profile_run(ComprehensiveNLPAnalyzer()) == 'ARTICLE TEXT'
+
+
+def test_learned_profile_moves_selector_forward():
+    analyzer = ComprehensiveNLPAnalyzer(learn_profiles_after=3)
+    assert profile_run(analyzer) == 'sidebar'
+    assert analyzer.scoring_key() != ComprehensiveNLPAnalyzer().scoring_key()
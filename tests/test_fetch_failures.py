@@ -0,0 +1,145 @@
+"""
+Fetch failure handling against a local fault-injecting HTTP stub
+
+Each test gets a fresh stub server whose paths misbehave on purpose:
+/flaky answers 503 twice then 200, /limited answers 429 with a
+Retry-After once then 200, /down always answers 500, /doc.pdf serves a
+PDF and anything else is a small article page.
+"""
+import asyncio
+import os
+import socket
+import sys
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import (AsyncNLPAnalyzer, CircuitBreaker, ComprehensiveNLPAnalyzer,
+                                   FetchPolicy, HostUnavailable, ResponseRejected)
+
+PAGE = b"<html><body><article><p>We love good things. I hate bad ones.</p></article></body></html>"
+
+
+class FaultHandler(BaseHTTPRequestHandler):
+    """Stub responses chosen by path; hits are counted per path on the server"""
+
+    def do_GET(self):
+        hits = self.server.hits
+        hits[self.path] += 1
+        if self.path == '/flaky' and hits[self.path] <= 2:
+            return self.reply(503)
+        if self.path == '/limited' and hits[self.path] == 1:
+            return self.reply(429, {'Retry-After': '3'})
+        if self.path == '/down':
+            return self.reply(500)
+        if self.path == '/doc.pdf':
+            return self.reply(200, {'Content-Type': 'application/pdf'}, b'%PDF-1.7 binary')
+        self.reply(200)
+
+    def reply(self, status, headers=None, body=None):
+        body = body if body is not None else (PAGE if status == 200 else b'error')
+        headers = headers or {}
+        self.send_response(status)
+        self.send_header('Content-Type', headers.pop('Content-Type', 'text/html; charset=utf-8'))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), FaultHandler)
+    httpd.hits = Counter()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_analyzer(retries=2, failure_threshold=5, reset_after=60.0):
+    """Analyzer without pacing whose retry waits are recorded instead of slept"""
+    analyzer = ComprehensiveNLPAnalyzer(
+        host_delay=0, fetch_policy=FetchPolicy(retries=retries, backoff=0.01, timeout=2),
+        circuit_breaker=CircuitBreaker(failure_threshold, reset_after), record_failures=True)
+    analyzer.waits = []
+    analyzer.wait_before_retry = analyzer.waits.append
+    return analyzer
+
+
+def test_retries_503_until_success(server):
+    analyzer = make_analyzer()
+    assert analyzer.fetch_html(server.base + '/flaky') == PAGE
+    assert server.hits['/flaky'] == 3
+    assert len(analyzer.waits) == 2
+    assert not analyzer.breaker.is_open('127.0.0.1:%d' % server.server_address[1])
+
+
+def test_429_waits_for_retry_after(server):
+    analyzer = make_analyzer()
+    assert analyzer.fetch_html(server.base + '/limited') == PAGE
+    assert server.hits['/limited'] == 2
+    assert analyzer.waits[0] >= 3
+
+
+def test_always_500_gives_up_and_opens_circuit(server):
+    analyzer = make_analyzer(retries=2, failure_threshold=3)
+    title, content, reason = analyzer.extract_article(server.base + '/down')
+    assert (title, content, reason) == ('', '', 'HTTP 500')
+    assert server.hits['/down'] == 3
+
+    # The circuit is now open: other pages on the host fail without a request
+    with pytest.raises(HostUnavailable):
+        analyzer.fetch_html(server.base + '/ok')
+    assert server.hits['/ok'] == 0
+
+
+def test_connection_refused_is_retried_then_reported():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    analyzer = make_analyzer(retries=1)
+    _, content, reason = analyzer.extract_article(f"http://127.0.0.1:{port}/gone")
+    assert content == ''
+    assert reason == 'connection error'
+    assert len(analyzer.waits) == 1
+
+
+def test_rejected_half_open_probe_does_not_keep_circuit_open(server):
+    analyzer = make_analyzer(retries=0, failure_threshold=2, reset_after=0)
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            analyzer.fetch_html(server.base + '/down')
+
+    # The trial request after the cool-down is a PDF and gets rejected
+    with pytest.raises(ResponseRejected):
+        analyzer.fetch_html(server.base + '/doc.pdf')
+    assert analyzer.fetch_html(server.base + '/ok') == PAGE
+
+
+def test_async_rejected_half_open_probe_does_not_keep_circuit_open(server):
+    analyzer = make_analyzer(retries=0, failure_threshold=2, reset_after=0)
+
+    async def run():
+        nlp = AsyncNLPAnalyzer(analyzer)
+        nlp.http = None    # requests in worker threads, with or without aiohttp
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                await nlp.fetch_html(server.base + '/down')
+        with pytest.raises(ResponseRejected):
+            await nlp.fetch_html(server.base + '/doc.pdf')
+        return await nlp.fetch_html(server.base + '/ok')
+
+    assert asyncio.run(run()) == PAGE
@@ -0,0 +1,38 @@
+"""CheckpointJournal resume rules"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import CheckpointJournal
+
+
+def row(url_id, words):
+    return {'URL_ID': url_id, 'URL': f"http://example.com/{url_id}", 'WORD COUNT': words}
+
+
+def test_rows_from_other_scoring_key_are_not_reused(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    old = CheckpointJournal(path, 'old-key')
+    old.append(row('a', 10))
+    old.append(row('b', 20))
+    new = CheckpointJournal(path, 'new-key')
+    new.append(row('b', 25))
+
+    records = CheckpointJournal(path, 'new-key').load()
+    assert list(records) == ['b']
+    assert records['b'] == row('b', 25)
+    assert CheckpointJournal.is_complete(records['b'], 'http://example.com/b')
+
+    # The old run's rows are still valid for a run with the old settings
+    assert CheckpointJournal(path, 'old-key').load() == {'a': row('a', 10)}
+
+
+def test_torn_last_line_is_skipped(tmp_path):
+    path = str(tmp_path / 'journal.jsonl')
+    journal = CheckpointJournal(path, 'key')
+    journal.append(row('a', 10))
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"URL_ID": "b", "UR')
+    assert list(CheckpointJournal(path, 'key').load()) == ['a']
@@ -0,0 +1,50 @@
+"""Compiled lexicon artifact"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import (LEXICON_FILE, NEGATIVE_WORDS_FILE, POSITIVE_WORDS_FILE,
+                                   ComprehensiveNLPAnalyzer, lexicon_source_stamp, read_lexicon)
+
+
+def make_sources(root):
+    (root / 'MasterDictionary').mkdir()
+    (root / 'StopWords').mkdir()
+    (root / POSITIVE_WORDS_FILE).write_text('good\ngreat\n', encoding='utf-8')
+    (root / NEGATIVE_WORDS_FILE).write_text('bad\n', encoding='utf-8')
+    (root / 'StopWords' / 'StopWords_Generic.txt').write_text('THE\nAND\n', encoding='utf-8')
+
+
+def word_lists(analyzer):
+    return analyzer.positive_words, analyzer.negative_words, analyzer.stopwords
+
+
+def test_compiled_lexicon_matches_text_files(tmp_path):
+    make_sources(tmp_path)
+    parsed = ComprehensiveNLPAnalyzer()
+    parsed.load_word_lists(str(tmp_path), compiled=False)
+
+    ComprehensiveNLPAnalyzer().load_word_lists(str(tmp_path))
+    lexicon = read_lexicon(str(tmp_path / LEXICON_FILE), lexicon_source_stamp(str(tmp_path)))
+    assert lexicon == word_lists(parsed)
+
+    loaded = ComprehensiveNLPAnalyzer()
+    loaded.load_word_lists(str(tmp_path))
+    assert word_lists(loaded) == word_lists(parsed)
+
+
+def test_edited_source_rebuilds_lexicon(tmp_path):
+    make_sources(tmp_path)
+    ComprehensiveNLPAnalyzer().load_word_lists(str(tmp_path))
+    stamp = lexicon_source_stamp(str(tmp_path))
+
+    (tmp_path / POSITIVE_WORDS_FILE).write_text('good\ngreat\nsplendid\n', encoding='utf-8')
+    assert lexicon_source_stamp(str(tmp_path)) != stamp
+    assert read_lexicon(str(tmp_path / LEXICON_FILE), lexicon_source_stamp(str(tmp_path))) is None
+
+    analyzer = ComprehensiveNLPAnalyzer()
+    analyzer.load_word_lists(str(tmp_path))
+    assert 'splendid' in analyzer.positive_words
+    assert read_lexicon(str(tmp_path / LEXICON_FILE), lexicon_source_stamp(str(tmp_path)))
@@ -0,0 +1,106 @@
+"""Per-host pacing and concurrency against a local HTTP stub"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer, FetchPolicy
+
+WORDS = ['good', 'bad', 'we', 'market', 'growth', 'loss', 'i', 'strong', 'report', 'weak']
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Records when each request starts and how many are in flight per Host header"""
+
+    def do_GET(self):
+        server = self.server
+        host = self.headers['Host']
+        with server.lock:
+            server.starts.setdefault(host, []).append(time.monotonic())
+            server.in_flight[host] += 1
+            server.peak[host] = max(server.peak[host], server.in_flight[host])
+            server.peak_total = max(server.peak_total, sum(server.in_flight.values()))
+        time.sleep(server.latency)
+        with server.lock:
+            server.in_flight[host] -= 1
+
+        n = int(self.path.strip('/') or 0)
+        text = ' '.join(WORDS[(n * 7 + i * 3) % len(WORDS)] + ('.' if i % 6 == 5 else '') for i in range(60 + n))
+        body = f"<html><body><h1>Page {n}</h1><article><p>{text}</p></article></body></html>".encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), SlowHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.starts = {}
+    httpd.in_flight = Counter()
+    httpd.peak = Counter()
+    httpd.peak_total = 0
+    httpd.latency = 0.0
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    port = httpd.server_address[1]
+    # Two names for the same server are two hosts to the rate limiter
+    httpd.hosts = [f"127.0.0.1:{port}", f"localhost:{port}"]
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def fetch_all(analyzer, urls):
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return list(executor.map(analyzer.fetch_html, urls))
+
+
+def test_requests_to_one_host_are_spaced_by_host_delay(server):
+    analyzer = ComprehensiveNLPAnalyzer(host_delay=0.2, workers=4)
+    fetch_all(analyzer, [f"http://{server.hosts[0]}/{i}" for i in range(4)])
+    starts = sorted(server.starts[server.hosts[0]])
+    assert len(starts) == 4
+    assert min(b - a for a, b in zip(starts, starts[1:])) >= 0.18
+
+
+def test_in_flight_capped_per_host_while_hosts_run_in_parallel(server):
+    server.latency = 0.2
+    analyzer = ComprehensiveNLPAnalyzer(host_delay=0, max_per_host=2, workers=12,
+                                        fetch_policy=FetchPolicy(timeout=10))
+    fetch_all(analyzer, [f"http://{host}/{i}" for host in server.hosts for i in range(6)])
+    assert server.peak == {host: 2 for host in server.hosts}
+    assert server.peak_total == 4
+
+
+def test_workers_give_the_same_rows_as_a_serial_run(server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('input.csv', 'w', encoding='utf-8') as f:
+        f.write('URL_ID,URL\n' + ''.join(f"p{i},http://{server.hosts[i % 2]}/{i}\n" for i in range(12)))
+
+    def run(workers):
+        analyzer = ComprehensiveNLPAnalyzer(host_delay=0, workers=workers, max_per_host=2)
+
+        def load_word_lists(*args, **kwargs):
+            analyzer.positive_words = {'good', 'growth', 'strong'}
+            analyzer.negative_words = {'bad', 'loss', 'weak'}
+            analyzer.stopwords = {'report'}
+        analyzer.load_word_lists = load_word_lists
+        return analyzer.process_all_articles('input.csv', f"out{workers}.csv")
+
+    serial = run(1)
+    assert (serial['WORD COUNT'] > 0).all()
+    assert run(4).equals(serial)
@@ -0,0 +1,26 @@
+"""Re-scoring saved article texts"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer
+
+
+def test_reanalyze_follows_input_order(tmp_path):
+    source = tmp_path / 'articles'
+    source.mkdir()
+    for i in (0, 2, 10):
+        (source / f"id{i}.txt").write_text(f"Title: t\n\nContent:\nword {i} here.", encoding='utf-8')
+    (source / 'other.txt').write_text("Title: t\n\nContent:\nnot in the input.", encoding='utf-8')
+    input_file = tmp_path / 'input.csv'
+    input_file.write_text('URL_ID,URL\n' + ''.join(f"id{i},http://example.com/{i}\n" for i in range(12)),
+                          encoding='utf-8')
+
+    analyzer = ComprehensiveNLPAnalyzer()
+    analyzer.load_word_lists = lambda *args, **kwargs: None
+    results = analyzer.reanalyze_saved_articles(str(source), str(tmp_path / 'out.csv'), str(input_file))
+    assert list(results['URL_ID']) == [f"id{i}" for i in range(12)]
+    assert list(results['URL']) == [f"http://example.com/{i}" for i in range(12)]
+    assert [i for i, count in enumerate(results['WORD COUNT']) if count] == [0, 2, 10]
@@ -0,0 +1,46 @@
+"""ResponseCache reads, writes and eviction"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ResponseCache
+
+
+def test_round_trip_with_validators(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put('http://example.com/a', b'<html>a</html>', etag='"v1"')
+    meta, body = cache.get('http://example.com/a')
+    assert body == b'<html>a</html>'
+    assert meta['etag'] == '"v1"'
+    assert cache.get('http://example.com/missing') is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path), max_bytes=25)
+    cache.put('http://example.com/a', b'a' * 10)
+    cache.put('http://example.com/b', b'b' * 10)
+    os.utime(cache._paths('http://example.com/a')[1], (1, 1))
+    os.utime(cache._paths('http://example.com/b')[1], (2, 2))
+    cache.put('http://example.com/c', b'c' * 10)
+    assert cache.get('http://example.com/a') is None
+    assert cache.get('http://example.com/b') is not None
+    assert cache.total_bytes == 20
+
+
+def test_entry_evicted_after_read_still_returns_body(tmp_path, monkeypatch):
+    cache = ResponseCache(str(tmp_path))
+    cache.put('http://example.com/a', b'body')
+    body_path = cache._paths('http://example.com/a')[1]
+
+    # Simulate another thread's put() evicting the entry between the read and the touch
+    real_utime = os.utime
+
+    def evicted_utime(path, *args, **kwargs):
+        if path == body_path:
+            os.remove(path)
+        return real_utime(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, 'utime', evicted_utime)
+    assert cache.get('http://example.com/a')[1] == b'body'
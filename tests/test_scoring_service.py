@@ -0,0 +1,65 @@
+"""Request validation of the scoring service"""
+import json
+import os
+import sys
+import threading
+from http.client import HTTPConnection
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer, FetchPolicy, ScoringRequestHandler
+
+# Nothing listens on port 1, so articles fail fast without a real download
+DEAD_URL = 'http://127.0.0.1:1/article'
+
+
+@pytest.fixture
+def service():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ScoringRequestHandler)
+    server.daemon_threads = True
+    server.analyzer = ComprehensiveNLPAnalyzer(host_delay=0, fetch_policy=FetchPolicy(retries=0))
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def post(port, path, payload):
+    connection = HTTPConnection('127.0.0.1', port, timeout=10)
+    connection.request('POST', path, json.dumps(payload), {'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response.status, body
+
+
+@pytest.mark.parametrize('path, payload', [
+    ('/analyze', {'urls': 5}),
+    ('/analyze?stream=1', {'urls': [{'url_id': 'a'}]}),
+    ('/analyze', {'urls': [{'url': 5}]}),
+    ('/analyze', {'url': None}),
+    ('/score', {'texts': 'not a list'}),
+    ('/score?stream=1', {'texts': None}),
+])
+def test_malformed_batches_get_400(service, path, payload):
+    status, body = post(service, path, payload)
+    assert status == 400
+    assert 'Bad request' in json.loads(body)['error']
+
+
+def test_batch_urls_default_their_url_id(service):
+    status, body = post(service, '/analyze', {'urls': [{'url': DEAD_URL}, DEAD_URL]})
+    assert status == 200
+    ids = [row['URL_ID'] for row in json.loads(body)['results']]
+    assert ids == [ScoringRequestHandler.default_url_id(DEAD_URL)] * 2
+
+
+def test_score_batch(service):
+    status, body = post(service, '/score', {'texts': ['One sentence. Two sentences.', 'Three words here.']})
+    assert status == 200
+    assert [row['WORD COUNT'] for row in json.loads(body)['results']] == [4, 3]
@@ -0,0 +1,78 @@
+"""SentenceSegmenter counts, whole and chunked"""
+import os
+import random
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import CHUNK_CARRY_LIMIT, SentenceSegmenter
+
+compat = SentenceSegmenter('compat')
+abbreviations = SentenceSegmenter('abbreviations')
+
+
+def split_count(text):
+    """The original sentence count: non-blank pieces of re.split on terminator runs"""
+    return len([piece for piece in re.split(r'[.!?]+', text) if piece.strip()])
+
+
+def random_texts(n=2000, seed=0):
+    rng = random.Random(seed)
+    alphabet = 'ab .!?"\')\n\tMr.3xJ'
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 80))) for _ in range(n)]
+
+
+def random_chunks(text, rng):
+    chunks, i = [], 0
+    while i < len(text):
+        n = rng.randint(0, 12)
+        chunks.append(text[i:i + n])
+        i += n
+    return chunks
+
+
+def test_compat_matches_re_split():
+    for text in random_texts():
+        assert compat.count(text) == split_count(text), repr(text)
+
+
+@pytest.mark.parametrize('segmenter', [compat, abbreviations], ids=lambda s: s.mode)
+def test_chunked_count_matches_whole_count(segmenter):
+    rng = random.Random(1)
+    for text in random_texts(seed=2):
+        assert segmenter.count_chunks(random_chunks(text, rng)) == segmenter.count(text), repr(text)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("The rate rose to 3.5 percent. It fell later.", 2),
+    ("Dr. Smith arrived. He left.", 2),
+    ("J. Doe wrote it. Nobody read it.", 2),
+    ("The U.S. economy grew. Then it slowed.", 2),
+    ("See example.com for details. Or don't!", 2),
+    ("Mr. and Mrs. Jones said \"Really?\" and left.", 2),
+    ("... !!! ?", 0),
+])
+def test_abbreviation_mode_cases(text, expected):
+    assert abbreviations.count(text) == expected
+    assert abbreviations.count_chunks([text]) == expected
+
+
+@pytest.mark.parametrize('cut', range(1, len("Dr. Smith arrived. He left.")))
+def test_chunk_boundary_anywhere_inside_an_abbreviation(cut):
+    text = "Dr. Smith arrived. He left."
+    assert abbreviations.count_chunks([text[:cut], text[cut:]]) == 2
+
+
+@pytest.mark.parametrize('segmenter', [compat, abbreviations], ids=lambda s: s.mode)
+@pytest.mark.parametrize('text', [
+    'word ' * (3 * CHUNK_CARRY_LIMIT) + 'Dr. Smith ends. next',
+    'Mr. Smith walked 3.5 km to Washington D.C. and e.g. paid $4. ' * 500,
+    ' ' * (3 * CHUNK_CARRY_LIMIT) + 'Lt. Dan.',
+])
+def test_long_carry_is_trimmed_without_changing_the_count(segmenter, text):
+    chunks = [text[i:i + 1000] for i in range(0, len(text), 1000)]
+    assert segmenter.count_chunks(chunks) == segmenter.count(text)
@@ -0,0 +1,56 @@
+"""Keep-alive connection reuse of the shared session"""
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import ComprehensiveNLPAnalyzer
+
+PAGE = b"<html><body><article><p>Kept alive.</p></article></body></html>"
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 page server that counts the connections it accepts"""
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servers():
+    started = []
+    for _ in range(3):
+        httpd = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        httpd.daemon_threads = True
+        httpd.connections = 0
+        threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+        started.append(httpd)
+    yield started
+    for httpd in started:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_small_pool_keeps_connections_across_hosts(servers):
+    analyzer = ComprehensiveNLPAnalyzer(pool_size=1, host_delay=0)
+    for _ in range(4):
+        for httpd in servers:
+            assert analyzer.fetch_html(f"http://127.0.0.1:{httpd.server_address[1]}/") == PAGE
+    assert [httpd.connections for httpd in servers] == [1, 1, 1]
@@ -0,0 +1,21 @@
+"""count_syllables_batch agrees with the per-word syllable count"""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from complete_nlp_analyzer import WORD_PATTERN, count_syllables_batch, syllable_count
+
+
+def test_batch_matches_syllable_count():
+    rng = random.Random(0)
+    words = ['', 'e', 'the', 'Queue', 'rhythm', 'yes', 'AREA', 'cafe', 'beautiful', 'x1e']
+    words += [''.join(rng.choice('aeiouybcdklmnrstE_1') for _ in range(rng.randrange(1, 12)))
+              for _ in range(2000)]
+    with open(os.path.join(ROOT, 'README.md'), encoding='utf-8') as f:
+        words += WORD_PATTERN.findall(f.read())
+
+    assert count_syllables_batch(words).tolist() == [syllable_count(word.lower()) for word in words]
+    assert count_syllables_batch([]).tolist() == []